@@ -286,6 +286,12 @@ class AlertService:
         if self.event_bus:
             await self.event_bus.stop_listening()
             await self.event_bus.disconnect()
+        if self._email_handler:
+            await self._email_handler.close()
+        if self._slack_handler:
+            await self._slack_handler.close()
+        if self._discord_handler:
+            await self._discord_handler.close()
         logger.info("Alert service shutdown")
     
     async def send_alert(self, alert: Alert) -> bool:
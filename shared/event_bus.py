@@ -18,6 +18,13 @@ from datetime import datetime
 from dataclasses import dataclass, asdict
 from functools import wraps
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -77,6 +84,9 @@ class EventType(Enum):
     MARKET_DATA_UPDATE = "market.data.update"
     MARKET_CLOSED = "market.closed"
     MARKET_OPENED = "market.opened"
+    
+    # News events
+    NEWS_BREAKING = "news.breaking"
 
 
 class EventPriority(Enum):
@@ -569,6 +579,67 @@ class AsyncEventBus:
         logger.error(f"Failed to publish event {event_type.value}")
         return False
     
+    async def publish_many(
+        self,
+        event_type: EventType,
+        data_list: List[Dict[str, Any]],
+        priority: EventPriority = EventPriority.NORMAL,
+        correlation_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Publish several events of one type in a single pipelined round trip.
+        
+        Args:
+            event_type: Type of event to publish
+            data_list: Payload data, one entry per event
+            priority: Event priority level
+            correlation_id: Optional correlation ID shared by all events
+            metadata: Optional additional metadata
+            
+        Returns:
+            True if published successfully, False otherwise
+        """
+        if not self._connected:
+            logger.error("Cannot publish: Event bus not connected")
+            return False
+        
+        if not data_list:
+            return True
+        
+        timestamp = datetime.utcnow().isoformat() + "Z"
+        dumps = orjson.dumps if ORJSON_AVAILABLE else json.dumps
+        messages = [
+            dumps(Event(
+                event_type=event_type.value,
+                data=data,
+                timestamp=timestamp,
+                source_service=self.service_name,
+                correlation_id=correlation_id or str(uuid.uuid4()),
+                priority=priority.value,
+                metadata=metadata
+            ).to_dict())
+            for data in data_list
+        ]
+        channel = self._get_channel(event_type)
+        
+        for attempt in range(self.max_retries):
+            try:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for message in messages:
+                        pipe.publish(channel, message)
+                    await pipe.execute()
+                logger.debug(f"Published {len(messages)} {event_type.value} events")
+                return True
+            except Exception as e:
+                logger.warning(f"Publish attempt {attempt + 1} failed: {e}")
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(self.retry_delay)
+                    await self.connect()
+        
+        logger.error(f"Failed to publish {len(messages)} {event_type.value} events")
+        return False
+    
     async def subscribe(
         self,
         event_type: EventType,
@@ -22,18 +22,47 @@ import os
 import asyncio
 import aiohttp
 import feedparser
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Set, Union
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from contextlib import suppress
+from email.utils import parsedate_to_datetime
 from enum import Enum
+from io import BytesIO
+from operator import attrgetter
+from urllib.parse import urlsplit
 import hashlib
+import heapq
+import itertools
 import json
 import re
+import time
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore
+    ORJSON_AVAILABLE = False
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    aioredis = None  # type: ignore
+    REDIS_AVAILABLE = False
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    etree = None  # type: ignore
+    LXML_AVAILABLE = False
 
 try:
     from .logging_config import get_logger
     from .metrics import get_metrics_registry
-    from .event_bus import EventBus
+    from .event_bus import EventBus, EventType
 except ImportError:
     import logging
     def get_logger(name: str, **kwargs):
@@ -48,6 +77,7 @@ except ImportError:
         return None
     
     EventBus = None
+    EventType = None
 
 
 class NewsSource(str, Enum):
@@ -58,7 +88,7 @@ class NewsSource(str, Enum):
     RSS = "rss"
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsArticle:
     """Represents a news article."""
     id: str
@@ -92,9 +122,28 @@ class NewsArticle:
             "sentiment_score": self.sentiment_score,
             "relevance_score": self.relevance_score,
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "NewsArticle":
+        """Create article from dictionary."""
+        return cls(
+            id=data["id"],
+            title=data["title"],
+            description=data["description"],
+            content=data.get("content"),
+            url=data["url"],
+            source=NewsSource(data["source"]),
+            source_name=data["source_name"],
+            published_at=_parse_iso_time(data["published_at"]),
+            author=data.get("author"),
+            image_url=data.get("image_url"),
+            keywords=data.get("keywords") or [],
+            sentiment_score=data.get("sentiment_score"),
+            relevance_score=data.get("relevance_score"),
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsFeedConfig:
     """Configuration for news feed."""
     # API Keys
@@ -121,34 +170,193 @@ class NewsFeedConfig:
     requests_per_minute: int = 30
     cache_ttl_seconds: int = 300  # 5 minutes
     
+    # Per-source cache TTLs, keyed by API source name or RSS feed host.
+    # Sources not listed fall back to cache_ttl_seconds.
+    source_ttls: Dict[str, int] = field(default_factory=lambda: {
+        "newsapi": 60,
+        "alpha_vantage": 1800,
+        "feeds.reuters.com": 60,
+        "rss.nytimes.com": 300,
+        "www.coindesk.com": 180,
+    })
+    refresh_interval_seconds: int = 30
+    
     # Fetch settings
     max_articles_per_source: int = 50
     lookback_hours: int = 24
+    rss_max_concurrency: int = 20
+    rss_timeout_seconds: float = 10.0
+
+
+# Sort key for newest-first article ordering
+_published_key = attrgetter("published_at")
+
+# Both accept raw response bytes; orjson is several times faster on the
+# multi-megabyte Alpha Vantage payloads
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+_json_dumps = orjson.dumps if ORJSON_AVAILABLE else json.dumps
+
+_CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+_DC_CREATOR = "{http://purl.org/dc/elements/1.1/}creator"
+_DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+
+
+def _parse_feed_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse an RSS (RFC-822) or Atom (ISO-8601) date into naive UTC."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Exceptions that indicate a malformed article payload rather than a bug
+_MALFORMED_ERRORS = (AttributeError, KeyError, TypeError, ValueError)
+
+
+def _article_id(key: str) -> str:
+    """Derive a stable 16-character article ID from its URL or title."""
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+def _parse_av_time(value: str) -> datetime:
+    """Parse an Alpha Vantage ``YYYYMMDDTHHMMSS`` timestamp without strptime."""
+    return datetime(
+        int(value[0:4]), int(value[4:6]), int(value[6:8]),
+        int(value[9:11]), int(value[11:13]), int(value[13:15]),
+    )
+
+
+def _parse_iso_time(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp into naive UTC, treating ``Z`` as UTC."""
+    if value.endswith("Z"):
+        return datetime.fromisoformat(value[:-1])
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _utc_timestamp(value: datetime) -> float:
+    """Get the POSIX timestamp of a naive-UTC datetime."""
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+def _interleave_by_host(urls: List[str]) -> List[str]:
+    """
+    Order URLs round-robin across hosts.
+    
+    Feeds sharing a host are spread apart so they do not queue behind each
+    other on the connector's per-host limit while other hosts sit idle.
+    """
+    by_host: Dict[str, List[str]] = {}
+    for url in urls:
+        by_host.setdefault(urlsplit(url).netloc, []).append(url)
+    
+    return [
+        url
+        for group in itertools.zip_longest(*by_host.values())
+        for url in group
+        if url is not None
+    ]
+
+
+def _fast_rss_parse(xml_bytes: bytes) -> List[Dict[str, Any]]:
+    """
+    Parse an RSS/Atom document with a streaming lxml parser.
+    
+    Only the fields used by RSSFeedClient._parse_entries are extracted, and
+    entries are returned in the same shape feedparser produces so both
+    parsers share one downstream path. Elements are cleared as soon as they
+    are consumed, keeping memory flat for large feeds.
+    
+    Raises:
+        etree.XMLSyntaxError: If the document is not well-formed XML
+    """
+    entries = []
+    for _, elem in etree.iterparse(
+        BytesIO(xml_bytes),
+        events=("end",),
+        tag=("{*}item", "{*}entry"),
+        resolve_entities=False,
+    ):
+        link = elem.findtext("{*}link")
+        if not link:
+            link_elem = elem.find("{*}link")
+            link = link_elem.get("href", "") if link_elem is not None else ""
+        
+        published_at = _parse_feed_date(
+            elem.findtext("{*}pubDate")
+            or elem.findtext("{*}published")
+            or elem.findtext(_DC_DATE)
+            or elem.findtext("{*}updated")
+        )
+        
+        author = (
+            elem.findtext("{*}author/{*}name")
+            or elem.findtext("{*}author")
+            or elem.findtext(_DC_CREATOR)
+        )
+        content = elem.findtext(_CONTENT_ENCODED) or elem.findtext("{*}content")
+        
+        entry = {
+            "title": elem.findtext("{*}title") or "",
+            "id": elem.findtext("{*}guid") or elem.findtext("{*}id") or "",
+            "summary": elem.findtext("{*}description") or elem.findtext("{*}summary") or "",
+            "published_parsed": published_at.timetuple() if published_at else None,
+            "author": author.strip() if author else None,
+            "content": [{"value": content}] if content else None,
+        }
+        # Leave "link" unset when absent so callers fall back to the id
+        if link and link.strip():
+            entry["link"] = link.strip()
+        entries.append(entry)
+        
+        # Free the element and any already-processed siblings
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+    
+    return entries
 
 
 class NewsAPIClient:
     """Client for NewsAPI.org."""
     
     BASE_URL = "https://newsapi.org/v2"
+    DEFAULT_COUNTRY = "us"
     
     def __init__(self, api_key: str, session: aiohttp.ClientSession):
         self.api_key = api_key
         self.session = session
         self.logger = get_logger("news.newsapi")
+        
+        # Static query parameters; each request copies and overlays these
+        self._headline_params = {"apiKey": api_key, "country": self.DEFAULT_COUNTRY}
+        self._search_params = {"apiKey": api_key, "sortBy": "publishedAt", "language": "en"}
     
     async def fetch_top_headlines(
         self,
-        country: str = "us",
+        country: str = DEFAULT_COUNTRY,
         category: Optional[str] = None,
         query: Optional[str] = None,
         page_size: int = 50,
     ) -> List[NewsArticle]:
         """Fetch top headlines."""
-        params = {
-            "apiKey": self.api_key,
-            "country": country,
-            "pageSize": min(page_size, 100),
-        }
+        params = self._headline_params.copy()
+        params["pageSize"] = min(page_size, 100)
+        if country != self.DEFAULT_COUNTRY:
+            params["country"] = country
         if category:
             params["category"] = category
         if query:
@@ -163,7 +371,7 @@ class NewsAPIClient:
                     self.logger.error(f"NewsAPI error: {response.status}")
                     return []
                 
-                data = await response.json()
+                data = _json_loads(await response.read())
                 return self._parse_articles(data.get("articles", []))
                 
         except Exception as e:
@@ -179,13 +387,11 @@ class NewsAPIClient:
         page_size: int = 50,
     ) -> List[NewsArticle]:
         """Search all articles."""
-        params = {
-            "apiKey": self.api_key,
-            "q": query,
-            "sortBy": sort_by,
-            "pageSize": min(page_size, 100),
-            "language": "en",
-        }
+        params = self._search_params.copy()
+        params["q"] = query
+        params["pageSize"] = min(page_size, 100)
+        if sort_by != "publishedAt":
+            params["sortBy"] = sort_by
         if from_date:
             params["from"] = from_date.strftime("%Y-%m-%dT%H:%M:%S")
         if to_date:
@@ -200,7 +406,7 @@ class NewsAPIClient:
                     self.logger.error(f"NewsAPI error: {response.status}")
                     return []
                 
-                data = await response.json()
+                data = _json_loads(await response.read())
                 return self._parse_articles(data.get("articles", []))
                 
         except Exception as e:
@@ -208,38 +414,50 @@ class NewsAPIClient:
             return []
     
     def _parse_articles(self, articles: List[Dict]) -> List[NewsArticle]:
-        """Parse NewsAPI articles."""
+        """Parse NewsAPI articles, skipping malformed ones."""
         result = []
+        skipped = 0
         for article in articles:
             try:
-                # Generate unique ID
-                article_id = hashlib.md5(
-                    (article.get("url", "") + article.get("title", "")).encode()
-                ).hexdigest()
-                
-                # Parse published date
-                published_str = article.get("publishedAt", "")
-                try:
-                    published_at = datetime.fromisoformat(published_str.replace("Z", "+00:00"))
-                except:
-                    published_at = datetime.utcnow()
-                
-                result.append(NewsArticle(
-                    id=article_id,
-                    title=article.get("title", ""),
-                    description=article.get("description", ""),
-                    content=article.get("content"),
-                    url=article.get("url", ""),
-                    source=NewsSource.NEWSAPI,
-                    source_name=article.get("source", {}).get("name", "Unknown"),
-                    published_at=published_at,
-                    author=article.get("author"),
-                    image_url=article.get("urlToImage"),
-                ))
-            except Exception as e:
-                self.logger.warning(f"Failed to parse article: {e}")
+                parsed = self._parse_article(article)
+            except _MALFORMED_ERRORS:
+                parsed = None
+            if parsed is None:
+                skipped += 1
+            else:
+                result.append(parsed)
+        
+        if skipped:
+            self.logger.debug(f"Skipped {skipped} malformed NewsAPI articles")
         
+        # Newest first, so fetch_all can merge sources without a full sort
+        result.sort(key=_published_key, reverse=True)
         return result
+    
+    def _parse_article(self, article: Dict) -> Optional[NewsArticle]:
+        """Parse a single NewsAPI article, or None if it has no URL or title."""
+        url = article.get("url") or ""
+        title = article.get("title") or ""
+        if not url and not title:
+            return None
+        
+        # Parse published date
+        published_at = None
+        with suppress(ValueError):
+            published_at = _parse_iso_time(article.get("publishedAt") or "")
+        
+        return NewsArticle(
+            id=_article_id(url + title),
+            title=title,
+            description=article.get("description") or "",
+            content=article.get("content"),
+            url=url,
+            source=NewsSource.NEWSAPI,
+            source_name=(article.get("source") or {}).get("name") or "Unknown",
+            published_at=published_at or datetime.utcnow(),
+            author=article.get("author"),
+            image_url=article.get("urlToImage"),
+        )
 
 
 class AlphaVantageNewsClient:
@@ -251,23 +469,28 @@ class AlphaVantageNewsClient:
         self.api_key = api_key
         self.session = session
         self.logger = get_logger("news.alphavantage")
+        
+        # Static query parameters; each request copies and overlays these
+        self._sentiment_params = {"function": "NEWS_SENTIMENT", "apikey": api_key}
     
     async def fetch_news_sentiment(
         self,
-        tickers: Optional[List[str]] = None,
-        topics: Optional[List[str]] = None,
+        tickers: Optional[Union[str, List[str]]] = None,
+        topics: Optional[Union[str, List[str]]] = None,
         limit: int = 50,
     ) -> List[NewsArticle]:
-        """Fetch news with sentiment analysis."""
-        params = {
-            "function": "NEWS_SENTIMENT",
-            "apikey": self.api_key,
-            "limit": min(limit, 200),
-        }
+        """
+        Fetch news with sentiment analysis.
+        
+        Tickers and topics may be passed pre-joined (comma-separated) by
+        callers that reuse the same selection on every request.
+        """
+        params = self._sentiment_params.copy()
+        params["limit"] = min(limit, 200)
         if tickers:
-            params["tickers"] = ",".join(tickers)
+            params["tickers"] = tickers if isinstance(tickers, str) else ",".join(tickers)
         if topics:
-            params["topics"] = ",".join(topics)
+            params["topics"] = topics if isinstance(topics, str) else ",".join(topics)
         
         try:
             async with self.session.get(self.BASE_URL, params=params) as response:
@@ -275,7 +498,7 @@ class AlphaVantageNewsClient:
                     self.logger.error(f"Alpha Vantage error: {response.status}")
                     return []
                 
-                data = await response.json()
+                data = _json_loads(await response.read())
                 return self._parse_articles(data.get("feed", []))
                 
         except Exception as e:
@@ -283,46 +506,62 @@ class AlphaVantageNewsClient:
             return []
     
     def _parse_articles(self, articles: List[Dict]) -> List[NewsArticle]:
-        """Parse Alpha Vantage articles."""
+        """Parse Alpha Vantage articles, skipping malformed ones."""
         result = []
+        skipped = 0
         for article in articles:
             try:
-                article_id = hashlib.md5(
-                    article.get("url", "").encode()
-                ).hexdigest()
-                
-                # Parse time
-                time_str = article.get("time_published", "")
-                try:
-                    published_at = datetime.strptime(time_str, "%Y%m%dT%H%M%S")
-                except:
-                    published_at = datetime.utcnow()
-                
-                # Extract sentiment
-                sentiment = article.get("overall_sentiment_score", 0)
-                
-                result.append(NewsArticle(
-                    id=article_id,
-                    title=article.get("title", ""),
-                    description=article.get("summary", ""),
-                    content=article.get("summary"),
-                    url=article.get("url", ""),
-                    source=NewsSource.ALPHA_VANTAGE,
-                    source_name=article.get("source", "Unknown"),
-                    published_at=published_at,
-                    author=", ".join(article.get("authors", [])),
-                    image_url=article.get("banner_image"),
-                    sentiment_score=float(sentiment) if sentiment else None,
-                ))
-            except Exception as e:
-                self.logger.warning(f"Failed to parse article: {e}")
+                parsed = self._parse_article(article)
+            except _MALFORMED_ERRORS:
+                parsed = None
+            if parsed is None:
+                skipped += 1
+            else:
+                result.append(parsed)
+        
+        if skipped:
+            self.logger.debug(f"Skipped {skipped} malformed Alpha Vantage articles")
         
+        result.sort(key=_published_key, reverse=True)
         return result
+    
+    def _parse_article(self, article: Dict) -> Optional[NewsArticle]:
+        """Parse a single Alpha Vantage article, or None if it has no URL."""
+        url = article.get("url")
+        if not url:
+            return None
+        
+        # Parse time
+        published_at = None
+        with suppress(ValueError):
+            published_at = _parse_av_time(article.get("time_published") or "")
+        
+        # Extract sentiment
+        sentiment = None
+        with suppress(TypeError, ValueError):
+            sentiment = float(article.get("overall_sentiment_score")) or None
+        
+        return NewsArticle(
+            id=_article_id(url),
+            title=article.get("title") or "",
+            description=article.get("summary") or "",
+            content=article.get("summary"),
+            url=url,
+            source=NewsSource.ALPHA_VANTAGE,
+            source_name=article.get("source") or "Unknown",
+            published_at=published_at or datetime.utcnow(),
+            author=", ".join(article.get("authors") or []),
+            image_url=article.get("banner_image"),
+            sentiment_score=sentiment,
+        )
 
 
 class RSSFeedClient:
     """Client for RSS feeds."""
     
+    # Feeds are XML text and compress 3-5x; aiohttp decompresses transparently
+    REQUEST_HEADERS = {"Accept-Encoding": "gzip, deflate"}
+    
     def __init__(self, session: aiohttp.ClientSession):
         self.session = session
         self.logger = get_logger("news.rss")
@@ -330,55 +569,84 @@ class RSSFeedClient:
     async def fetch_feed(self, feed_url: str) -> List[NewsArticle]:
         """Fetch and parse RSS feed."""
         try:
-            async with self.session.get(feed_url) as response:
+            async with self.session.get(feed_url, headers=self.REQUEST_HEADERS) as response:
                 if response.status != 200:
                     self.logger.error(f"RSS fetch error: {response.status} for {feed_url}")
                     return []
                 
-                content = await response.text()
-                feed = feedparser.parse(content)
-                return self._parse_entries(feed.entries, feed_url)
+                # Keep the body as bytes; the parsers detect the encoding
+                # from the XML declaration, avoiding a decode/re-encode
+                content = await response.read()
+                return self._parse_entries(self._parse_feed(content, feed_url), feed_url)
                 
         except Exception as e:
             self.logger.error(f"RSS fetch error for {feed_url}: {e}")
             return []
     
+    def _parse_feed(self, content: bytes, feed_url: str) -> List:
+        """Parse feed bytes, preferring the streaming lxml parser."""
+        if LXML_AVAILABLE:
+            try:
+                return _fast_rss_parse(content)
+            except etree.XMLSyntaxError as e:
+                self.logger.debug(f"Falling back to feedparser for {feed_url}: {e}")
+        
+        return feedparser.parse(content).entries
+    
     def _parse_entries(self, entries: List, feed_url: str) -> List[NewsArticle]:
-        """Parse RSS feed entries."""
+        """Parse RSS feed entries, skipping malformed ones."""
+        source_name = urlsplit(feed_url).netloc
         result = []
+        skipped = 0
         for entry in entries:
             try:
-                article_id = hashlib.md5(
-                    entry.get("link", entry.get("id", "")).encode()
-                ).hexdigest()
-                
-                # Parse published date
-                published = entry.get("published_parsed") or entry.get("updated_parsed")
-                if published:
-                    published_at = datetime(*published[:6])
-                else:
-                    published_at = datetime.utcnow()
-                
-                # Extract description
-                description = entry.get("summary", entry.get("description", ""))
-                # Strip HTML tags
-                description = re.sub(r'<[^>]+>', '', description)
-                
-                result.append(NewsArticle(
-                    id=article_id,
-                    title=entry.get("title", ""),
-                    description=description[:500],
-                    content=entry.get("content", [{}])[0].get("value") if entry.get("content") else None,
-                    url=entry.get("link", ""),
-                    source=NewsSource.RSS,
-                    source_name=feed_url.split("/")[2],  # Extract domain
-                    published_at=published_at,
-                    author=entry.get("author"),
-                ))
-            except Exception as e:
-                self.logger.warning(f"Failed to parse RSS entry: {e}")
+                parsed = self._parse_entry(entry, source_name)
+            except _MALFORMED_ERRORS:
+                parsed = None
+            if parsed is None:
+                skipped += 1
+            else:
+                result.append(parsed)
         
+        if skipped:
+            self.logger.debug(f"Skipped {skipped} malformed entries from {feed_url}")
+        
+        result.sort(key=_published_key, reverse=True)
         return result
+    
+    def _parse_entry(self, entry: Dict, source_name: str) -> Optional[NewsArticle]:
+        """Parse a single RSS entry, or None if it has neither link nor id."""
+        link = entry.get("link") or ""
+        key = link or entry.get("id") or ""
+        if not key:
+            return None
+        
+        # Parse published date
+        published = entry.get("published_parsed") or entry.get("updated_parsed")
+        published_at = datetime(*published[:6]) if published else datetime.utcnow()
+        
+        # Extract description, stripping HTML tags only when the kept
+        # prefix could contain one
+        description = entry.get("summary") or entry.get("description") or ""
+        head = description[:500]
+        if "<" in head:
+            description = _HTML_TAG_RE.sub("", description)[:500]
+        else:
+            description = head
+        
+        content = entry.get("content")
+        
+        return NewsArticle(
+            id=_article_id(key),
+            title=entry.get("title") or "",
+            description=description,
+            content=content[0].get("value") if content else None,
+            url=link,
+            source=NewsSource.RSS,
+            source_name=source_name,
+            published_at=published_at,
+            author=entry.get("author"),
+        )
 
 
 class NewsFeedAggregator:
@@ -410,10 +678,20 @@ class NewsFeedAggregator:
         "https://www.coindesk.com/arc/outboundfeeds/rss/",
     ]
     
+    # Alpha Vantage topics polled by fetch_all, pre-joined for the query string
+    ALPHA_VANTAGE_TOPICS = "economy_fiscal,economy_monetary,finance,technology"
+    
+    # Shared article store (sorted-set index scored by publish time)
+    ARTICLE_INDEX_KEY = "predictbot:news:articles"
+    ARTICLE_PREFIX = "predictbot:news:article:"
+    ARTICLE_STORE_TTL = 86400  # seconds
+    REDIS_RETRY_INTERVAL = 30.0  # seconds between reconnect attempts
+    
     def __init__(
         self,
         config: Optional[NewsFeedConfig] = None,
         event_bus: Optional[Any] = None,
+        redis_url: Optional[str] = None,
     ):
         """
         Initialize news feed aggregator.
@@ -421,10 +699,15 @@ class NewsFeedAggregator:
         Args:
             config: News feed configuration
             event_bus: Optional EventBus for publishing events
+            redis_url: Optional Redis URL for an article store shared
+                between aggregator workers
         """
         self.logger = get_logger("news.aggregator")
         self.metrics = get_metrics_registry()
         self.event_bus = event_bus
+        self.redis_url = redis_url
+        self._redis: Optional[Any] = None  # redis.Redis when available
+        self._redis_retry_at = 0.0  # monotonic time of the next connect attempt
         
         # Load config from environment if not provided
         self.config = config or NewsFeedConfig(
@@ -435,8 +718,11 @@ class NewsFeedAggregator:
         )
         
         self._session: Optional[aiohttp.ClientSession] = None
-        self._cache: Dict[str, tuple] = {}  # {cache_key: (articles, timestamp)}
+        self._cache: Dict[str, tuple] = {}  # {cache_key: (articles, monotonic_time)}
         self._seen_ids: Set[str] = set()
+        self._keyword_matcher: Optional[tuple] = None  # (keywords, lowered, regex)
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._inflight: Dict[str, asyncio.Task] = {}  # {cache_key: fetch task}
         
         # Initialize clients
         self._newsapi: Optional[NewsAPIClient] = None
@@ -460,49 +746,222 @@ class NewsFeedAggregator:
         return self._session
     
     async def close(self) -> None:
-        """Close HTTP session."""
+        """Stop background refresh and close HTTP session."""
+        await self.stop_refresh_loop()
+        for task in list(self._inflight.values()):
+            task.cancel()
         if self._session and not self._session.closed:
             await self._session.close()
+        if self._redis:
+            await self._redis.close()
+    
+    async def _get_redis(self) -> Optional[Any]:
+        """Get Redis connection for the shared article store, if configured."""
+        if not self.redis_url or not REDIS_AVAILABLE or aioredis is None:
+            return None
+        
+        if self._redis is None:
+            # Back off after a failure so an outage doesn't add a connect
+            # timeout to every fetch
+            if time.monotonic() < self._redis_retry_at:
+                return None
+            try:
+                self._redis = aioredis.from_url(self.redis_url)
+                await self._redis.ping()
+            except Exception as e:
+                self.logger.warning(f"Redis connection failed, using local articles: {e}")
+                self._redis = None
+                self._redis_retry_at = time.monotonic() + self.REDIS_RETRY_INTERVAL
+        
+        return self._redis
+    
+    async def _store_articles(self, articles: List[NewsArticle]) -> None:
+        """Write articles to the shared store in a single pipelined round trip."""
+        redis_client = await self._get_redis()
+        if not redis_client or not articles:
+            return
+        
+        # Scores are POSIX timestamps (see _utc_timestamp)
+        expire_before = time.time() - self.ARTICLE_STORE_TTL
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.zadd(self.ARTICLE_INDEX_KEY, {
+                    article.id: _utc_timestamp(article.published_at)
+                    for article in articles
+                })
+                for article in articles:
+                    pipe.set(
+                        f"{self.ARTICLE_PREFIX}{article.id}",
+                        _json_dumps(article.to_dict()),
+                        ex=self.ARTICLE_STORE_TTL,
+                    )
+                pipe.zremrangebyscore(self.ARTICLE_INDEX_KEY, "-inf", expire_before)
+                await pipe.execute()
+        except Exception as e:
+            self.logger.warning(f"Failed to store articles in Redis: {e}")
+    
+    async def get_recent_articles(
+        self,
+        since: datetime,
+        limit: int = 50,
+    ) -> Optional[List[NewsArticle]]:
+        """
+        Read articles published after ``since`` from the shared store.
+        
+        Includes articles ingested by every aggregator worker sharing the
+        store, whether or not this worker has already returned them.
+        
+        Returns:
+            Newest-first articles, or None if the store is unavailable
+        """
+        redis_client = await self._get_redis()
+        if not redis_client:
+            return None
+        
+        try:
+            ids = await redis_client.zrevrangebyscore(
+                self.ARTICLE_INDEX_KEY, "+inf", f"({_utc_timestamp(since)}",
+                start=0, num=limit,
+            )
+            if not ids:
+                return []
+            rows = await redis_client.mget([
+                f"{self.ARTICLE_PREFIX}{i.decode() if isinstance(i, bytes) else i}"
+                for i in ids
+            ])
+        except Exception as e:
+            self.logger.warning(f"Failed to read articles from Redis: {e}")
+            return None
+        
+        return [NewsArticle.from_dict(_json_loads(row)) for row in rows if row]
+    
+    async def start_refresh_loop(self) -> None:
+        """
+        Start refreshing sources in the background as their TTLs expire.
+        
+        With the loop running, fetch_all is served almost entirely from cache.
+        """
+        if self._refresh_task and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.create_task(self._refresh_loop())
+    
+    async def stop_refresh_loop(self) -> None:
+        """Stop the background refresh loop."""
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
     
-    def _get_cache(self, key: str) -> Optional[List[NewsArticle]]:
+    async def _refresh_loop(self) -> None:
+        """Background task that re-fetches any source whose TTL has elapsed."""
+        while True:
+            try:
+                await self._get_session()
+                await self._fetch_sources()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"News refresh error: {e}")
+            await asyncio.sleep(self.config.refresh_interval_seconds)
+    
+    def _source_ttl(self, source: str) -> int:
+        """Get the cache TTL for a source name or RSS feed host."""
+        return self.config.source_ttls.get(source, self.config.cache_ttl_seconds)
+    
+    def _get_cache(self, key: str, ttl_seconds: Optional[int] = None) -> Optional[List[NewsArticle]]:
         """Get cached articles if not expired."""
-        if key in self._cache:
-            articles, timestamp = self._cache[key]
-            if datetime.utcnow() - timestamp < timedelta(seconds=self.config.cache_ttl_seconds):
-                return articles
+        if ttl_seconds is None:
+            ttl_seconds = self.config.cache_ttl_seconds
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() - entry[1] < ttl_seconds:
+            return entry[0]
         return None
     
     def _set_cache(self, key: str, articles: List[NewsArticle]) -> None:
         """Cache articles."""
-        self._cache[key] = (articles, datetime.utcnow())
+        self._cache[key] = (articles, time.monotonic())
     
-    def _filter_by_keywords(self, articles: List[NewsArticle]) -> List[NewsArticle]:
+    async def _fetch_cached(
+        self,
+        key: str,
+        ttl_seconds: int,
+        fetch: Callable[[], Awaitable[List[NewsArticle]]],
+    ) -> List[NewsArticle]:
+        """
+        Get cached articles, fetching and caching them once the TTL expires.
+        
+        Callers that find the same key expired while a fetch is in flight
+        (e.g. fetch_all overlapping the refresh loop) await that fetch
+        instead of issuing the request again.
+        """
+        cached = self._get_cache(key, ttl_seconds)
+        if cached:
+            return cached
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_into_cache(key, fetch))
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            self._inflight[key] = task
+        
+        # Shielded so a cancelled caller (e.g. stop_refresh_loop) doesn't
+        # abort the fetch for the others waiting on it
+        return await asyncio.shield(task)
+    
+    async def _fetch_into_cache(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[List[NewsArticle]]],
+    ) -> List[NewsArticle]:
+        """Run one fetch for a cache key and cache its result."""
+        articles = await fetch()
+        self._set_cache(key, articles)
+        return articles
+    
+    def _get_keyword_matcher(self) -> tuple:
+        """
+        Get lowered keywords and a compiled matcher for the current keywords.
+        
+        Rebuilt only when config.keywords changes (including the temporary
+        override in get_market_relevant_news).
+        """
+        keywords = tuple(self.config.keywords)
+        if self._keyword_matcher is None or self._keyword_matcher[0] != keywords:
+            lowered = [k.lower() for k in keywords]
+            # Unanchored, matching the substring semantics of the keyword scan
+            alternation = "|".join(re.escape(k) for k in set(lowered))
+            regex = re.compile(alternation, re.IGNORECASE)
+            self._keyword_matcher = (keywords, lowered, regex)
+        return self._keyword_matcher
+    
+    def _filter_by_keywords(self, articles: Iterable[NewsArticle]) -> Iterator[NewsArticle]:
         """Filter articles by configured keywords."""
         if not self.config.keywords:
-            return articles
+            yield from articles
+            return
         
-        keywords_lower = [k.lower() for k in self.config.keywords]
-        filtered = []
+        _, keywords_lower, regex = self._get_keyword_matcher()
         
         for article in articles:
-            text = f"{article.title} {article.description}".lower()
-            matching_keywords = [k for k in keywords_lower if k in text]
+            text = f"{article.title} {article.description}"
             
-            if matching_keywords:
-                article.keywords = matching_keywords
-                article.relevance_score = len(matching_keywords) / len(keywords_lower)
-                filtered.append(article)
-        
-        return filtered
+            # One regex pass rejects most articles; only matches pay for the
+            # per-keyword scan, which also finds overlapping keywords
+            if regex.search(text):
+                text = text.lower()
+                article.keywords = [k for k in keywords_lower if k in text]
+                article.relevance_score = len(article.keywords) / len(keywords_lower)
+                yield article
     
-    def _deduplicate(self, articles: List[NewsArticle]) -> List[NewsArticle]:
+    def _deduplicate(self, articles: Iterable[NewsArticle]) -> Iterator[NewsArticle]:
         """Remove duplicate articles."""
-        unique = []
         for article in articles:
             if article.id not in self._seen_ids:
                 self._seen_ids.add(article.id)
-                unique.append(article)
-        return unique
+                yield article
     
     async def fetch_all(
         self,
@@ -521,78 +980,110 @@ class NewsFeedAggregator:
         """
         await self._get_session()
         
-        all_articles = []
-        tasks = []
+        sorted_lists = await self._fetch_sources()
         
-        # NewsAPI
-        if self._newsapi:
-            tasks.append(self._fetch_newsapi())
-        
-        # Alpha Vantage
-        if self._alphavantage:
-            tasks.append(self._fetch_alphavantage())
-        
-        # RSS feeds
-        if self._rss and self.config.rss_feeds:
-            for feed_url in self.config.rss_feeds:
-                tasks.append(self._rss.fetch_feed(feed_url))
-        
-        # Fetch all in parallel
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        for result in results:
-            if isinstance(result, Exception):
-                self.logger.error(f"Fetch error: {result}")
-            elif isinstance(result, list):
-                all_articles.extend(result)
+        # Every source list is newest-first, so a k-way merge yields the
+        # final order and the filters below can run lazily over it
+        articles: Iterable[NewsArticle] = heapq.merge(
+            *sorted_lists, key=_published_key, reverse=True
+        )
         
         # Filter by age
         if max_age_hours:
             cutoff = datetime.utcnow() - timedelta(hours=max_age_hours)
-            all_articles = [a for a in all_articles if a.published_at > cutoff]
+            articles = itertools.takewhile(lambda a: a.published_at > cutoff, articles)
+        
+        # Drop already-delivered articles before the keyword scan; cached
+        # source lists are re-merged on every call, so most rows are repeats
+        seen_ids = self._seen_ids
+        articles = (a for a in articles if a.id not in seen_ids)
         
         # Filter by keywords
         if filter_keywords:
-            all_articles = self._filter_by_keywords(all_articles)
+            articles = self._filter_by_keywords(articles)
         
         # Deduplicate
-        all_articles = self._deduplicate(all_articles)
+        all_articles = list(self._deduplicate(articles))
         
-        # Sort by published date (newest first)
-        all_articles.sort(key=lambda a: a.published_at, reverse=True)
+        await self._store_articles(all_articles)
         
         self.logger.info(f"Fetched {len(all_articles)} articles from all sources")
         
         return all_articles
     
+    async def _fetch_sources(self) -> List[List[NewsArticle]]:
+        """
+        Fetch every configured source, honouring each source's cache TTL.
+        
+        Returns:
+            One newest-first article list per source that returned successfully
+        """
+        tasks = []
+        
+        # NewsAPI
+        if self._newsapi:
+            tasks.append(self._fetch_newsapi())
+        
+        # Alpha Vantage
+        if self._alphavantage:
+            tasks.append(self._fetch_alphavantage())
+        
+        # RSS feeds (bounded, interleaved across hosts)
+        if self._rss and self.config.rss_feeds:
+            semaphore = asyncio.Semaphore(self.config.rss_max_concurrency)
+            for feed_url in _interleave_by_host(self.config.rss_feeds):
+                tasks.append(self._fetch_rss(feed_url, semaphore))
+        
+        # Fetch all in parallel, collecting results as they arrive
+        sorted_lists = []
+        for next_result in asyncio.as_completed(tasks):
+            try:
+                result = await next_result
+            except Exception as e:
+                self.logger.error(f"Fetch error: {e!r}")
+                continue
+            if isinstance(result, list):
+                sorted_lists.append(result)
+        
+        return sorted_lists
+    
+    async def _fetch_rss(
+        self,
+        feed_url: str,
+        semaphore: asyncio.Semaphore,
+    ) -> List[NewsArticle]:
+        """Fetch an RSS feed under the shared concurrency limit and timeout."""
+        async def fetch() -> List[NewsArticle]:
+            async with semaphore:
+                return await asyncio.wait_for(
+                    self._rss.fetch_feed(feed_url),
+                    timeout=self.config.rss_timeout_seconds,
+                )
+        
+        return await self._fetch_cached(
+            f"rss:{feed_url}", self._source_ttl(urlsplit(feed_url).netloc), fetch
+        )
+    
     async def _fetch_newsapi(self) -> List[NewsArticle]:
         """Fetch from NewsAPI."""
-        cache_key = "newsapi_headlines"
-        cached = self._get_cache(cache_key)
-        if cached:
-            return cached
-        
-        articles = await self._newsapi.fetch_top_headlines(
-            page_size=self.config.max_articles_per_source
+        return await self._fetch_cached(
+            "newsapi_headlines",
+            self._source_ttl(NewsSource.NEWSAPI.value),
+            lambda: self._newsapi.fetch_top_headlines(
+                page_size=self.config.max_articles_per_source
+            ),
         )
-        
-        self._set_cache(cache_key, articles)
-        return articles
     
     async def _fetch_alphavantage(self) -> List[NewsArticle]:
         """Fetch from Alpha Vantage."""
-        cache_key = "alphavantage_news"
-        cached = self._get_cache(cache_key)
-        if cached:
-            return cached
-        
-        articles = await self._alphavantage.fetch_news_sentiment(
-            topics=["economy_fiscal", "economy_monetary", "finance", "technology"],
-            limit=self.config.max_articles_per_source
+        return await self._fetch_cached(
+            "alphavantage_news",
+            self._source_ttl(NewsSource.ALPHA_VANTAGE.value),
+            lambda: self._alphavantage.fetch_news_sentiment(
+                topics=self.ALPHA_VANTAGE_TOPICS,
+                limit=self.config.max_articles_per_source
+            ),
         )
-        
-        self._set_cache(cache_key, articles)
-        return articles
     
     async def search(
         self,
@@ -627,11 +1118,10 @@ class NewsFeedAggregator:
             )
             articles.extend(newsapi_results)
         
-        # Deduplicate and sort
-        articles = self._deduplicate(articles)
-        articles.sort(key=lambda a: a.published_at, reverse=True)
+        # Deduplicate (results are already newest-first)
+        articles = list(itertools.islice(self._deduplicate(articles), max_results))
         
-        return articles[:max_results]
+        return articles
     
     async def get_breaking_news(
         self,
@@ -653,12 +1143,15 @@ class NewsFeedAggregator:
             max_age_hours=1
         )
         
-        breaking = [a for a in articles if a.published_at > cutoff]
+        # Articles are newest-first, so stop at the first one past the cutoff
+        breaking = list(itertools.takewhile(lambda a: a.published_at > cutoff, articles))
         
-        # Publish to event bus if we have breaking news
+        # Publish to event bus if we have breaking news (top 5, one round trip)
         if breaking and self.event_bus:
-            for article in breaking[:5]:  # Limit to top 5
-                await self.event_bus.publish("news.breaking", article.to_dict())
+            await self.event_bus.publish_many(
+                EventType.NEWS_BREAKING,
+                [article.to_dict() for article in breaking[:5]],
+            )
         
         return breaking
     
@@ -704,6 +1197,7 @@ class NewsFeedAggregator:
 # Convenience function to create aggregator from environment
 def create_news_aggregator(
     event_bus: Optional[Any] = None,
+    redis_url: Optional[str] = None,
 ) -> NewsFeedAggregator:
     """
     Create a news feed aggregator from environment variables.
@@ -715,8 +1209,9 @@ def create_news_aggregator(
     
     Args:
         event_bus: Optional EventBus for publishing events
+        redis_url: Optional Redis URL for the shared article store
         
     Returns:
         Configured NewsFeedAggregator
     """
-    return NewsFeedAggregator(event_bus=event_bus)
+    return NewsFeedAggregator(event_bus=event_bus, redis_url=redis_url)
@@ -6,13 +6,79 @@ Supports severity-based colors and structured message layouts.
 """
 
 import asyncio
+import json
 import logging
+import random
+import time
 import aiohttp
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a value to JSON bytes, preferring orjson."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value)
+    return json.dumps(value).encode()
+
+
+# Alert attributes shown as inline embed fields when set:
+# (field name, Alert attribute, optional value format)
+_ALERT_FIELD_SCHEMA = (
+    ("Type", "alert_type", None),
+    ("Source", "source", None),
+    ("Entity Type", "related_entity_type", None),
+    ("Entity ID", "related_entity_id", "`{}`"),
+)
+
+@lru_cache(maxsize=256)
+def _title_key(key: str) -> str:
+    """Format a metadata key as a field name (``strategy_id`` -> ``Strategy Id``)."""
+    return key.replace("_", " ").title()
+
+
+# (epoch second, ISO-8601 string) for the most recent _now_iso() call
+_ts_cache: tuple = (0, "")
+
+
+def _now_iso() -> str:
+    """Get the current UTC time as ISO-8601, cached at one-second resolution."""
+    global _ts_cache
+    sec = int(time.time())
+    if sec != _ts_cache[0]:
+        _ts_cache = (sec, datetime.fromtimestamp(sec, tz=timezone.utc).isoformat())
+    return _ts_cache[1]
+
+
+def _retry_after(headers: Any) -> float:
+    """Read the Retry-After delay (seconds) from a rate-limited response."""
+    try:
+        return max(float(headers.get("Retry-After", 1)), 0.0)
+    except (TypeError, ValueError):
+        return 1.0
+
+
+def _embed_size(embed: Dict[str, Any]) -> int:
+    """Count the characters Discord charges against the per-message embed limit."""
+    size = len(embed.get("title", "")) + len(embed.get("description") or "")
+    size += len(embed.get("footer", {}).get("text", ""))
+    for field in embed.get("fields", ()):
+        size += len(field["name"]) + len(field["value"])
+    return size
+
 # Import Alert type for type hints
 try:
     from ..alert_service import Alert
@@ -30,23 +96,42 @@ class DiscordNotifier:
     and footer information.
     """
     
-    # Severity to color mapping (Discord uses decimal colors)
-    SEVERITY_COLORS = {
-        "critical": 0xdc3545,  # Red
-        "high": 0xfd7e14,      # Orange
-        "medium": 0xffc107,    # Yellow
-        "low": 0x17a2b8,       # Cyan
-        "info": 0x6c757d,      # Gray
+    __slots__ = (
+        "webhook_url", "username", "avatar_url", "mention_roles",
+        "mention_users", "thread_id", "timeout", "batched", "batch_window",
+        "dedupe_window", "max_retries", "_critical_mentions", "_post_url",
+        "_enabled", "_payload_prefix", "_session", "_recent", "_queue", "_flusher_task",
+        "_sem",
+    )
+    
+    # Severity to (color, emoji) mapping (Discord uses decimal colors)
+    SEVERITY_META = {
+        "critical": (0xdc3545, "🚨"),  # Red
+        "high": (0xfd7e14, "⚠️"),      # Orange
+        "medium": (0xffc107, "📢"),    # Yellow
+        "low": (0x17a2b8, "ℹ️"),       # Cyan
+        "info": (0x6c757d, "📝"),      # Gray
     }
+    DEFAULT_SEVERITY_META = (0x6c757d, "📢")
     
-    # Severity to emoji mapping
-    SEVERITY_EMOJIS = {
-        "critical": "🚨",
-        "high": "⚠️",
-        "medium": "📢",
-        "low": "ℹ️",
-        "info": "📝",
+    SEVERITY_COLORS = {k: meta[0] for k, meta in SEVERITY_META.items()}
+    SEVERITY_EMOJIS = {k: meta[1] for k, meta in SEVERITY_META.items()}
+    
+    # System/service status to (color, emoji) mapping
+    STATUS_META = {
+        "healthy": (0x28a745, "✅"),
+        "degraded": (0xffc107, "⚠️"),
+        "unhealthy": (0xdc3545, "❌"),
     }
+    DEFAULT_STATUS_META = (0x6c757d, "❓")
+    
+    # Discord limits for a single webhook message
+    MAX_EMBEDS_PER_MESSAGE = 10
+    MAX_MESSAGE_CHARS = 6000
+    
+    # Characters a single alert embed may use, leaving headroom under
+    # MAX_MESSAGE_CHARS for the footer and timestamp
+    EMBED_CHAR_BUDGET = 5000
     
     def __init__(self, config: Dict[str, Any]):
         """
@@ -60,6 +145,15 @@ class DiscordNotifier:
                 - mention_roles: List of role IDs to mention for critical alerts
                 - mention_users: List of user IDs to mention for critical alerts
                 - thread_id: Thread ID to post in (optional)
+                - batched: Coalesce alerts sent within batch_window into
+                  one POST (default True). send_alert then returns once
+                  the alert is queued rather than delivered.
+                - batch_window: Seconds to wait for more alerts (default 0.25)
+                - dedupe_window: Seconds during which an identical alert
+                  is suppressed (default 60, 0 disables)
+                - max_retries: Retries for rate-limited (429), 5xx and
+                  connection failures (default 3)
+                - max_inflight: Maximum concurrent webhook POSTs (default 5)
         """
         self.webhook_url = config.get("webhook_url")
         self.username = config.get("username", "PredictBot Alerts")
@@ -68,6 +162,170 @@ class DiscordNotifier:
         self.mention_users = config.get("mention_users", [])
         self.thread_id = config.get("thread_id")
         self.timeout = config.get("timeout", 10)
+        self.batched = config.get("batched", True)
+        self.batch_window = config.get("batch_window", 0.25)
+        self.dedupe_window = config.get("dedupe_window", 60.0)
+        self.max_retries = config.get("max_retries", 3)
+        
+        # Admission control for webhook POSTs; excess sends wait here
+        # instead of piling up on the connector and drawing 429s
+        self._sem = asyncio.Semaphore(config.get("max_inflight", 5))
+        
+        self._enabled = bool(self.webhook_url)
+        
+        # Mention content for critical alerts, built once
+        self.set_mentions(self.mention_roles, self.mention_users)
+        
+        # Webhook target never changes after construction
+        self._post_url = (
+            f"{self.webhook_url}?thread_id={self.thread_id}"
+            if self.thread_id else self.webhook_url
+        )
+        
+        # Static payload fields, pre-encoded as an unterminated JSON object
+        # that _encode_payload completes with the per-message fields
+        static_fields: Dict[str, Any] = {"username": self.username}
+        if self.avatar_url:
+            static_fields["avatar_url"] = self.avatar_url
+        self._payload_prefix = _dumps(static_fields)[:-1]
+        
+        # Shared HTTP session (created lazily, see close())
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Recently sent alert content -> monotonic send time, oldest first
+        self._recent: Dict[tuple, float] = {}
+        
+        # Pending (content, embed) pairs for batched alerts
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._flusher_task: Optional[asyncio.Task] = None
+    
+    def set_mentions(
+        self,
+        roles: Optional[List[str]] = None,
+        users: Optional[List[str]] = None
+    ) -> None:
+        """
+        Update who is mentioned on critical alerts.
+        
+        This is the only supported way to change mentions after construction,
+        since the mention string is precomputed here rather than on each send.
+        
+        Args:
+            roles: Role IDs to mention (None keeps the current roles)
+            users: User IDs to mention (None keeps the current users)
+        """
+        if roles is not None:
+            self.mention_roles = list(roles)
+        if users is not None:
+            self.mention_users = list(users)
+        self._critical_mentions = " ".join(
+            [f"<@&{role_id}>" for role_id in self.mention_roles]
+            + [f"<@{user_id}>" for user_id in self.mention_users]
+        )
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the shared HTTP session for webhook requests."""
+        if self._session is None or self._session.closed:
+            # The session-level timeout applies to every request
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(
+                    limit=20,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                ),
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        """Deliver queued alerts and close the HTTP session. Call on shutdown."""
+        await self.flush()
+        if self._flusher_task:
+            self._flusher_task.cancel()
+            try:
+                await self._flusher_task
+            except asyncio.CancelledError:
+                pass
+            self._flusher_task = None
+        
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def flush(self) -> None:
+        """Wait until every queued alert has been posted."""
+        if self._flusher_task and not self._flusher_task.done():
+            # Also stop waiting if the flusher exits, so flush never hangs
+            joined = asyncio.ensure_future(self._queue.join())
+            await asyncio.wait(
+                (joined, self._flusher_task), return_when=asyncio.FIRST_COMPLETED
+            )
+            joined.cancel()
+    
+    def _enqueue(self, content: str, embed: Dict[str, Any]) -> None:
+        """Queue an embed for the next batched POST."""
+        self._queue.put_nowait((content, embed))
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.create_task(self._flush_loop())
+    
+    async def _flush_loop(self) -> None:
+        """
+        Background task that coalesces queued embeds into single POSTs.
+        
+        Waits batch_window after the first queued alert, then sends up to
+        MAX_EMBEDS_PER_MESSAGE embeds within Discord's total character limit.
+        """
+        pending = None
+        try:
+            while True:
+                if pending is None:
+                    pending = await self._queue.get()
+                    await asyncio.sleep(self.batch_window)
+                
+                batch = []
+                size = 0
+                item = pending
+                pending = None
+                while item is not None:
+                    try:
+                        item_size = _embed_size(item[1])
+                    except Exception as e:
+                        logger.error(f"Dropping malformed Discord embed: {e}")
+                        self._queue.task_done()
+                    else:
+                        if batch and size + item_size > self.MAX_MESSAGE_CHARS:
+                            pending = item
+                            break
+                        batch.append(item)
+                        size += item_size
+                    
+                    if len(batch) >= self.MAX_EMBEDS_PER_MESSAGE or self._queue.empty():
+                        break
+                    item = self._queue.get_nowait()
+                
+                if not batch:
+                    continue
+                try:
+                    await self._post_batch(batch)
+                except Exception as e:
+                    logger.error(f"Failed to post Discord batch: {e}")
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+        finally:
+            # An item carried over to the next batch was never posted
+            if pending is not None:
+                self._queue.task_done()
+    
+    async def _post_batch(self, batch: List[tuple]) -> bool:
+        """POST several (content, embed) pairs as one message."""
+        # Mentions repeat across critical alerts; send each once
+        content = " ".join(dict.fromkeys(c for c, _ in batch if c))
+        
+        sent = await self._post([embed for _, embed in batch], content)
+        if sent:
+            logger.info(f"Discord batch sent: {len(batch)} alert(s)")
+        return sent
     
     async def send_alert(self, alert: Alert) -> bool:
         """
@@ -77,108 +335,176 @@ class DiscordNotifier:
             alert: The alert to send
             
         Returns:
-            True if message was sent successfully
+            True if message was sent (or queued, when batched) successfully
         """
-        if not self.webhook_url:
+        if not self._enabled:
             logger.warning("Discord webhook URL not configured")
             return False
         
+        key = self._dedupe_key(alert)
+        if self._is_duplicate(key):
+            logger.debug(f"Suppressed duplicate Discord alert: {alert.alert_id}")
+            return True
+        
         try:
-            payload = self._build_payload(alert)
-            
-            # Add thread_id to URL if specified
-            url = self.webhook_url
-            if self.thread_id:
-                url = f"{url}?thread_id={self.thread_id}"
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
+            content, embed = self._build_embed(alert)
+        except Exception as e:
+            logger.error(f"Failed to build Discord alert: {e}")
+            return False
+        
+        if self.batched:
+            self._enqueue(content, embed)
+            self._remember(key)
+            return True
+        
+        sent = await self._send_embed(embed, content)
+        if sent:
+            self._remember(key)
+            logger.info(f"Discord alert sent: {alert.alert_id}")
+        return sent
+    
+    async def _send_embed(self, embed: Dict[str, Any], content: str = "") -> bool:
+        """
+        Send a single embed immediately.
+        
+        All send_* methods deliver through here, so webhook configuration is
+        checked in one place.
+        """
+        if not self._enabled:
+            logger.debug("Discord webhook URL not configured")
+            return False
+        
+        return await self._post([embed], content)
+    
+    def _dedupe_key(self, alert: Alert) -> tuple:
+        """Key identifying alerts with the same content."""
+        return (alert.title, alert.message, str(alert.severity), alert.source)
+    
+    def _is_duplicate(self, key: tuple) -> bool:
+        """Check whether an identical alert was sent within dedupe_window."""
+        if not self.dedupe_window:
+            return False
+        
+        sent_at = self._recent.get(key)
+        return sent_at is not None and time.monotonic() - sent_at < self.dedupe_window
+    
+    def _remember(self, key: tuple) -> None:
+        """Record an alert as sent once it has been queued or delivered."""
+        if not self.dedupe_window:
+            return
+        
+        # Re-insert so the dict stays ordered by send time, then drop
+        # expired entries from the front
+        now = time.monotonic()
+        self._recent.pop(key, None)
+        self._recent[key] = now
+        while True:
+            oldest = next(iter(self._recent))
+            if now - self._recent[oldest] < self.dedupe_window:
+                break
+            del self._recent[oldest]
+    
+    def _encode_payload(self, embeds: List[Dict[str, Any]], content: str = "") -> bytes:
+        """Encode a webhook payload onto the pre-serialized static fields."""
+        body = self._payload_prefix + b',"embeds":' + _dumps(embeds)
+        if content:
+            body += b',"content":' + _dumps(content)
+        return body + b"}"
+    
+    async def _post(self, embeds: List[Dict[str, Any]], content: str = "") -> bool:
+        """
+        POST embeds to the webhook, retrying transient failures.
+        
+        Rate-limited requests wait for Discord's Retry-After; server errors
+        and connection failures back off exponentially with full jitter.
+        
+        Returns:
+            True if Discord accepted the message
+        """
+        body = self._encode_payload(embeds, content)
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                session = await self._get_session()
+                async with self._sem, session.post(
+                    self._post_url,
+                    data=body,
+                    headers=_JSON_HEADERS,
                 ) as response:
                     if response.status in (200, 204):
-                        logger.info(f"Discord alert sent: {alert.alert_id}")
                         return True
-                    else:
-                        text = await response.text()
-                        logger.error(f"Discord API error: {response.status} - {text}")
-                        return False
-                        
-        except asyncio.TimeoutError:
-            logger.error("Discord webhook request timed out")
-            return False
-        except Exception as e:
-            logger.error(f"Failed to send Discord alert: {e}")
-            return False
+                    
+                    text = await response.text()
+                if response.status == 429:
+                    delay = _retry_after(response.headers)
+                elif response.status >= 500:
+                    delay = random.uniform(0, 0.5 * 2 ** attempt)
+                else:
+                    logger.error(f"Discord API error: {response.status} - {text}")
+                    return False
+                logger.warning(f"Discord API error: {response.status} - {text}")
+            except (asyncio.TimeoutError, aiohttp.ClientConnectorError) as e:
+                logger.warning(f"Discord webhook request failed: {e!r}")
+                delay = random.uniform(0, 0.5 * 2 ** attempt)
+            except Exception as e:
+                logger.error(f"Failed to send Discord message: {e}")
+                return False
+            
+            if attempt < self.max_retries:
+                await asyncio.sleep(delay)
+        
+        logger.error(f"Discord webhook failed after {self.max_retries + 1} attempts")
+        return False
     
-    def _build_payload(self, alert: Alert) -> Dict[str, Any]:
-        """Build Discord message payload with embeds."""
-        severity = alert.severity.value if hasattr(alert.severity, 'value') else str(alert.severity)
-        color = self.SEVERITY_COLORS.get(severity, 0x6c757d)
-        emoji = self.SEVERITY_EMOJIS.get(severity, "📢")
+    def _build_embed(self, alert: Alert) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build the Discord embed for an alert.
+        
+        Returns:
+            (content, embed) where content holds any mentions
+        """
+        severity = getattr(alert.severity, "value", None) or str(alert.severity)
+        color, emoji = self.SEVERITY_META.get(severity, self.DEFAULT_SEVERITY_META)
         timestamp = alert.timestamp.isoformat() if isinstance(alert.timestamp, datetime) else str(alert.timestamp)
         
-        # Build mention content for critical alerts
-        content = ""
-        if severity == "critical":
-            mentions = []
-            for role_id in self.mention_roles:
-                mentions.append(f"<@&{role_id}>")
-            for user_id in self.mention_users:
-                mentions.append(f"<@{user_id}>")
-            if mentions:
-                content = " ".join(mentions)
-        
-        # Build embed fields
-        fields = [
-            {
-                "name": "Severity",
-                "value": severity.upper(),
-                "inline": True
-            },
-            {
-                "name": "Type",
-                "value": alert.alert_type,
-                "inline": True
-            },
-            {
-                "name": "Source",
-                "value": alert.source,
-                "inline": True
-            }
-        ]
+        # Mention roles/users on critical alerts
+        content = self._critical_mentions if severity == "critical" else ""
         
-        # Add related entity info if present
-        if alert.related_entity_type:
-            fields.append({
-                "name": "Entity Type",
-                "value": alert.related_entity_type,
-                "inline": True
-            })
+        # Build embed fields (Discord rejects empty values, so unset
+        # attributes are skipped)
+        fields = [{"name": "Severity", "value": severity.upper(), "inline": True}]
+        fields += [
+            {"name": name, "value": fmt.format(value) if fmt else value, "inline": True}
+            for name, attr, fmt in _ALERT_FIELD_SCHEMA
+            if (value := getattr(alert, attr, None))
+        ]
         
-        if alert.related_entity_id:
-            fields.append({
-                "name": "Entity ID",
-                "value": f"`{alert.related_entity_id}`",
-                "inline": True
-            })
+        title = f"{emoji} {alert.title}"
         
-        # Add metadata fields (limit to avoid hitting Discord limits)
+        # Add metadata fields within a running character budget so the
+        # embed as a whole stays under Discord's limit
         if alert.metadata:
-            for key, value in list(alert.metadata.items())[:6]:
-                str_value = str(value)
-                if len(str_value) > 200:
-                    str_value = str_value[:197] + "..."
+            budget = self.EMBED_CHAR_BUDGET - len(title) - len(alert.message or "")
+            for field in fields:
+                budget -= len(field["name"]) + len(field["value"])
+            for key, value in islice(alert.metadata.items(), 6):
+                if budget < 100:
+                    break
+                name = _title_key(key)
+                str_value = value if type(value) is str else str(value)
+                limit = min(200, budget)
+                if len(str_value) > limit:
+                    str_value = f"{str_value[:limit - 3]}..."
+                budget -= len(name) + len(str_value)
                 fields.append({
-                    "name": key.replace("_", " ").title(),
+                    "name": name,
                     "value": str_value,
                     "inline": True
                 })
         
         # Build embed
         embed = {
-            "title": f"{emoji} {alert.title}",
+            "title": title,
             "description": alert.message,
             "color": color,
             "fields": fields,
@@ -188,19 +514,7 @@ class DiscordNotifier:
             "timestamp": timestamp
         }
         
-        # Build payload
-        payload = {
-            "username": self.username,
-            "embeds": [embed]
-        }
-        
-        if content:
-            payload["content"] = content
-        
-        if self.avatar_url:
-            payload["avatar_url"] = self.avatar_url
-        
-        return payload
+        return content, embed
     
     async def send_simple_message(
         self,
@@ -219,45 +533,18 @@ class DiscordNotifier:
         Returns:
             True if message was sent successfully
         """
-        if not self.webhook_url:
-            logger.warning("Discord webhook URL not configured")
-            return False
-        
-        color = self.SEVERITY_COLORS.get(severity, 0x6c757d)
-        emoji = self.SEVERITY_EMOJIS.get(severity, "📢")
+        color, emoji = self.SEVERITY_META.get(severity, self.DEFAULT_SEVERITY_META)
         
         embed = {
             "description": text,
             "color": color,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _now_iso()
         }
         
         if title:
             embed["title"] = f"{emoji} {title}"
         
-        payload = {
-            "username": self.username,
-            "embeds": [embed]
-        }
-        
-        if self.avatar_url:
-            payload["avatar_url"] = self.avatar_url
-        
-        url = self.webhook_url
-        if self.thread_id:
-            url = f"{url}?thread_id={self.thread_id}"
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as response:
-                    return response.status in (200, 204)
-        except Exception as e:
-            logger.error(f"Failed to send Discord message: {e}")
-            return False
+        return await self._send_embed(embed)
     
     async def send_trade_notification(
         self,
@@ -282,9 +569,6 @@ class DiscordNotifier:
         Returns:
             True if message was sent successfully
         """
-        if not self.webhook_url:
-            return False
-        
         # Determine emoji and color based on trade type and P&L
         if trade_type == "executed":
             if pnl is not None:
@@ -320,33 +604,11 @@ class DiscordNotifier:
             "title": f"{emoji} Trade {trade_type.title()}",
             "color": color,
             "fields": fields,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _now_iso(),
             "footer": {"text": "PredictBot Trading System"}
         }
         
-        payload = {
-            "username": self.username,
-            "embeds": [embed]
-        }
-        
-        if self.avatar_url:
-            payload["avatar_url"] = self.avatar_url
-        
-        url = self.webhook_url
-        if self.thread_id:
-            url = f"{url}?thread_id={self.thread_id}"
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as response:
-                    return response.status in (200, 204)
-        except Exception as e:
-            logger.error(f"Failed to send trade notification: {e}")
-            return False
+        return await self._send_embed(embed)
     
     async def send_daily_summary(
         self,
@@ -373,9 +635,6 @@ class DiscordNotifier:
         Returns:
             True if message was sent successfully
         """
-        if not self.webhook_url:
-            return False
-        
         pnl_emoji = "📈" if total_pnl >= 0 else "📉"
         color = 0x28a745 if total_pnl >= 0 else 0xdc3545
         
@@ -404,33 +663,11 @@ class DiscordNotifier:
             "title": f"📊 Daily Trading Summary - {date}",
             "color": color,
             "fields": fields,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _now_iso(),
             "footer": {"text": "PredictBot Trading System | Daily Summary"}
         }
         
-        payload = {
-            "username": self.username,
-            "embeds": [embed]
-        }
-        
-        if self.avatar_url:
-            payload["avatar_url"] = self.avatar_url
-        
-        url = self.webhook_url
-        if self.thread_id:
-            url = f"{url}?thread_id={self.thread_id}"
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as response:
-                    return response.status in (200, 204)
-        except Exception as e:
-            logger.error(f"Failed to send daily summary: {e}")
-            return False
+        return await self._send_embed(embed)
     
     async def send_status_update(
         self,
@@ -449,34 +686,21 @@ class DiscordNotifier:
         Returns:
             True if message was sent successfully
         """
-        if not self.webhook_url:
-            return False
-        
         # Determine color based on status
-        status_colors = {
-            "healthy": 0x28a745,
-            "degraded": 0xffc107,
-            "unhealthy": 0xdc3545
-        }
-        status_emojis = {
-            "healthy": "✅",
-            "degraded": "⚠️",
-            "unhealthy": "❌"
-        }
-        
-        color = status_colors.get(status.lower(), 0x6c757d)
-        emoji = status_emojis.get(status.lower(), "❓")
+        status_meta = self.STATUS_META
+        default_meta = self.DEFAULT_STATUS_META
+        color, emoji = status_meta.get(status.lower(), default_meta)
         
         # Build service status field
-        service_lines = []
-        for service, svc_status in services.items():
-            svc_emoji = status_emojis.get(svc_status.lower(), "❓")
-            service_lines.append(f"{svc_emoji} **{service}**: {svc_status}")
+        service_lines = "\n".join(
+            f"{status_meta.get(svc_status.lower(), default_meta)[1]} **{service}**: {svc_status}"
+            for service, svc_status in services.items()
+        )
         
         fields = [
             {
                 "name": "Services",
-                "value": "\n".join(service_lines) or "No services",
+                "value": service_lines or "No services",
                 "inline": False
             }
         ]
@@ -501,30 +725,8 @@ class DiscordNotifier:
             "title": f"{emoji} System Status: {status.title()}",
             "color": color,
             "fields": fields,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _now_iso(),
             "footer": {"text": "PredictBot Trading System | Status Update"}
         }
         
-        payload = {
-            "username": self.username,
-            "embeds": [embed]
-        }
-        
-        if self.avatar_url:
-            payload["avatar_url"] = self.avatar_url
-        
-        url = self.webhook_url
-        if self.thread_id:
-            url = f"{url}?thread_id={self.thread_id}"
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as response:
-                    return response.status in (200, 204)
-        except Exception as e:
-            logger.error(f"Failed to send status update: {e}")
-            return False
+        return await self._send_embed(embed)
@@ -6,16 +6,30 @@ Supports rate limiting and multiple recipients.
 """
 
 import asyncio
+import io
 import logging
 import smtplib
+import socket
 import ssl
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import Dict, Any, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email import policy
+from email.generator import BytesGenerator
+from email.message import EmailMessage
+from html import escape as _esc
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
+from dataclasses import dataclass, field
 from string import Template
 
+try:
+    import aiosmtplib
+    AIOSMTPLIB_AVAILABLE = True
+except ImportError:
+    AIOSMTPLIB_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # Import Alert type for type hints
@@ -27,6 +41,171 @@ except ImportError:
     AlertSeverity = Any
 
 
+@dataclass(slots=True)
+class _Derived:
+    """Per-alert display values, computed once and shared by the body builders."""
+    severity: str
+    severity_upper: str
+    color: str
+    timestamp: str
+
+
+@dataclass(slots=True)
+class _TestAlert:
+    """Alert sent by EmailNotifier.send_test_email."""
+    alert_id: str = "test-001"
+    alert_type: str = "test"
+    severity: str = "info"
+    title: str = "Test Alert"
+    message: str = "This is a test alert to verify email configuration."
+    source: str = "email-notifier"
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+    related_entity_type: Optional[str] = None
+    related_entity_id: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=lambda: {"test_key": "test_value"})
+
+
+class _TokenBucket:
+    """Token bucket allowing bursts of up to capacity, refilled at rate per second."""
+    
+    __slots__ = ("capacity", "rate", "tokens", "last")
+    
+    def __init__(self, capacity: float, rate: float):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self.last = time.monotonic()
+    
+    def try_consume(self, cost: float = 1) -> bool:
+        """Take cost tokens if available."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return True
+        return False
+
+
+class _TemplateVars(dict):
+    """Template variables that leave unknown placeholders untouched."""
+    
+    def __missing__(self, key: str) -> str:
+        return f"${{{key}}}"
+
+
+def _compile_template(source: str) -> str:
+    """
+    Compile string.Template source into an equivalent format string.
+    
+    Rendering then runs through str.format_map instead of re-scanning the
+    template with string.Template's regex on every alert.
+    """
+    parts = []
+    last = 0
+    for match in Template.pattern.finditer(source):
+        parts.append(source[last:match.start()].replace("{", "{{").replace("}", "}}"))
+        name = match.group("named") or match.group("braced")
+        if name:
+            parts.append(f"{{{name}}}")
+        else:
+            # "$$" and stray "$" both render as a literal "$"
+            parts.append("$")
+        last = match.end()
+    parts.append(source[last:].replace("{", "{{").replace("}", "}}"))
+    return "".join(parts)
+
+
+# Plain text body; the entity and metadata blocks are empty or end in a newline
+_TEXT_TEMPLATE = (
+    "PredictBot Alert\n"
+    + "=" * 50 + "\n"
+    "\n"
+    "Alert ID: {alert_id}\n"
+    "Severity: {severity_upper}\n"
+    "Type: {alert_type}\n"
+    "Time: {timestamp}\n"
+    "Source: {source}\n"
+    "\n"
+    "Title: {title}\n"
+    "\n"
+    "Message:\n"
+    "{message}\n"
+    "\n"
+    "{entity_block}"
+    "{metadata_block}"
+    "\n"
+    + "-" * 50 + "\n"
+    "This is an automated alert from PredictBot.\n"
+    "Do not reply to this email."
+)
+
+# Built-in HTML body used when no template exists for an alert type
+_DEFAULT_HTML_TEMPLATE = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="utf-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        </head>
+        <body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
+            <div style="background: linear-gradient(135deg, {color} 0%, {color}dd 100%); color: white; padding: 20px; border-radius: 8px 8px 0 0;">
+                <h1 style="margin: 0; font-size: 24px;">⚠️ PredictBot Alert</h1>
+                <p style="margin: 5px 0 0 0; opacity: 0.9;">{severity_upper} - {alert_type}</p>
+            </div>
+            
+            <div style="background: #f8f9fa; padding: 20px; border: 1px solid #dee2e6; border-top: none;">
+                <table style="width: 100%; font-size: 14px;">
+                    <tr>
+                        <td style="padding: 5px 0;"><strong>Alert ID:</strong></td>
+                        <td style="padding: 5px 0;">{alert_id}</td>
+                    </tr>
+                    <tr>
+                        <td style="padding: 5px 0;"><strong>Time:</strong></td>
+                        <td style="padding: 5px 0;">{timestamp}</td>
+                    </tr>
+                    <tr>
+                        <td style="padding: 5px 0;"><strong>Source:</strong></td>
+                        <td style="padding: 5px 0;">{source}</td>
+                    </tr>
+                </table>
+            </div>
+            
+            <div style="background: white; padding: 20px; border: 1px solid #dee2e6; border-top: none; border-radius: 0 0 8px 8px;">
+                <h2 style="color: #333; margin-top: 0;">{title}</h2>
+                <p style="color: #555; font-size: 16px;">{message}</p>
+                {entity_html}
+                {metadata_html}
+            </div>
+            
+            <div style="text-align: center; padding: 20px; color: #999; font-size: 12px;">
+                <p>This is an automated alert from PredictBot Trading System.</p>
+                <p>Do not reply to this email.</p>
+            </div>
+        </body>
+        </html>
+        """
+
+_METADATA_ROW_TEMPLATE = (
+    "<tr><td style='padding: 8px; border-bottom: 1px solid #eee;'><strong>{key}</strong></td>"
+    "<td style='padding: 8px; border-bottom: 1px solid #eee;'>{value}</td></tr>"
+)
+
+_METADATA_SECTION_TEMPLATE = """
+            <h3 style="color: #333; margin-top: 20px;">Additional Details</h3>
+            <table style="width: 100%; border-collapse: collapse;">
+                {rows}
+            </table>
+            """
+
+_ENTITY_TEMPLATE = """
+            <p style="color: #666; font-size: 14px;">
+                Related: {entity_type} 
+                {entity_id}
+            </p>
+            """
+
+
 class EmailNotifier:
     """
     Email notification handler using SMTP.
@@ -43,6 +222,30 @@ class EmailNotifier:
         "info": "#6c757d",      # Gray
     }
     
+    # Same colors keyed by AlertSeverity member, so enum severities are
+    # looked up directly without going through .value
+    SEVERITY_COLORS_BY_ENUM: Dict[Any, str] = {
+        AlertSeverity.CRITICAL: "#dc3545",
+        AlertSeverity.HIGH: "#fd7e14",
+        AlertSeverity.MEDIUM: "#ffc107",
+        AlertSeverity.LOW: "#17a2b8",
+        AlertSeverity.INFO: "#6c757d",
+    } if AlertSeverity is not Any else {}
+    
+    # Upper bound on remembered alerts for duplicate suppression
+    MAX_DEDUPE_ENTRIES = 10_000
+    
+    # Per-severity limits (emails per SEVERITY_RATE_WINDOW seconds) so a
+    # flood of low-priority alerts can't starve critical ones. Severities
+    # without a limit are only subject to the shared token bucket.
+    SEVERITY_RATE_WINDOW = 60.0
+    DEFAULT_SEVERITY_RATE_LIMITS = {
+        "high": 30,
+        "medium": 20,
+        "low": 10,
+        "info": 10,
+    }
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the email notifier.
@@ -60,6 +263,18 @@ class EmailNotifier:
                 - to_emails: List of recipient email addresses
                 - cc_emails: List of CC email addresses
                 - template_dir: Directory containing email templates
+                - local_hostname: Hostname sent in EHLO (default: local FQDN)
+                - rate_limit_capacity: Maximum burst of emails (default: 20)
+                - rate_limit_per_sec: Sustained emails per second (default: 1.0)
+                - severity_rate_limits: Emails per minute by severity
+                  (default: DEFAULT_SEVERITY_RATE_LIMITS)
+                - dedupe_window: Seconds during which an identical alert
+                  is suppressed (default: 30, 0 disables)
+                - max_batch: Queued emails sent back-to-back on one
+                  connection per batch (default: 10)
+                - queue_size: Maximum alerts waiting to be sent (default: 1024)
+                - smtp_workers: Threads for blocking smtplib calls when
+                  aiosmtplib is not installed (default: 2)
         """
         self.smtp_host = config.get("smtp_host", "localhost")
         self.smtp_port = config.get("smtp_port", 587)
@@ -71,246 +286,570 @@ class EmailNotifier:
         self.from_name = config.get("from_name", "PredictBot Alerts")
         self.to_emails = config.get("to_emails", [])
         self.cc_emails = config.get("cc_emails", [])
+        
+        # Recipients are fixed, so headers and the envelope list are built once
+        self._from_header = f"{self.from_name} <{self.from_email}>"
+        self._to_header = ", ".join(self.to_emails)
+        self._cc_header = ", ".join(self.cc_emails) if self.cc_emails else None
+        self._all_recipients = tuple(self.to_emails) + tuple(self.cc_emails)
         self.template_dir = Path(config.get("template_dir", "templates"))
         
-        # Cache for loaded templates
-        self._template_cache: Dict[str, str] = {}
+        # Resolve the EHLO hostname once; smtplib would otherwise call the
+        # (potentially slow) blocking resolver on every connect
+        self._local_hostname = config.get("local_hostname")
+        if not self._local_hostname:
+            try:
+                self._local_hostname = socket.getfqdn()
+            except OSError:
+                self._local_hostname = socket.gethostname()
+        
+        # Rate limiting; over-limit alerts are dropped before any rendering.
+        # The check never awaits, so coroutines sharing it need no lock.
+        self._bucket = _TokenBucket(
+            config.get("rate_limit_capacity", 20),
+            config.get("rate_limit_per_sec", 1.0),
+        )
+        self._severity_limits: Dict[str, int] = config.get(
+            "severity_rate_limits", self.DEFAULT_SEVERITY_RATE_LIMITS
+        )
+        # severity -> (previous window count, current window count, window start)
+        self._windows: Dict[str, Tuple[int, int, float]] = {}
+        
+        # Recently sent alert keys -> send time, oldest first
+        self.dedupe_window = config.get("dedupe_window", 30.0)
+        self._recent: Dict[tuple, float] = {}
+        
+        # Built once; loading the CA bundle on every connect is wasted work
+        self._ssl_context = ssl.create_default_context()
+        
+        # Shared SMTP connection, reused across sends (see close()). With
+        # aiosmtplib installed the connection is driven by the event loop;
+        # otherwise smtplib runs in a worker thread.
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_lock = threading.Lock()
+        # Private pool so SMTP stalls can't starve the loop's default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=config.get("smtp_workers", 2),
+            thread_name_prefix="email-smtp",
+        )
+        self._async_smtp: Optional["aiosmtplib.SMTP"] = None
+        self._async_smtp_lock = asyncio.Lock()
+        
+        # Outgoing alerts, drained in batches by a single worker task
+        self.max_batch = config.get("max_batch", 10)
+        self._send_queue: asyncio.Queue = asyncio.Queue(maxsize=config.get("queue_size", 1024))
+        self._send_worker_task: Optional[asyncio.Task] = None
+        
+        # Compiled templates keyed by file stem, loaded up front so sends
+        # never read template files from inside the event loop
+        self._template_cache: Dict[str, str] = self._load_templates()
     
-    async def send_alert(self, alert: Alert) -> bool:
+    async def send_alert(self, alert: Alert, wait: bool = False) -> bool:
         """
-        Send an alert via email.
+        Queue an alert to be sent via email.
+        
+        The alert is rendered and sent by a background worker, so by default
+        this returns as soon as it is queued; delivery results are logged.
         
         Args:
             alert: The alert to send
+            wait: Wait for the SMTP send and report its result. Waiting
+                callers want a real delivery, so duplicates are not suppressed.
             
         Returns:
-            True if email was sent successfully
+            True if the alert was queued (or, with wait, delivered), or was
+            suppressed as a duplicate
         """
         if not self.to_emails:
             logger.warning("No recipient emails configured")
             return False
         
+        key = self._dedupe_key(alert)
+        if not wait and self._is_duplicate(key):
+            logger.debug(f"Suppressed duplicate email alert: {alert.alert_id}")
+            return True
+        
+        # Severity windows are checked first so that low-priority floods are
+        # rejected before they drain the shared bucket
+        derived = self._derive(alert)
+        if not self._allow_severity(derived.severity) or not self._bucket.try_consume():
+            logger.warning(f"Email alert rate limited: {alert.alert_id}")
+            return False
+        
+        # Resolved by the worker with the delivery result
+        delivered = asyncio.get_running_loop().create_future() if wait else None
         try:
-            # Build email content
-            subject = self._build_subject(alert)
-            html_body = self._build_html_body(alert)
-            text_body = self._build_text_body(alert)
-            
-            # Create message
-            message = MIMEMultipart("alternative")
-            message["Subject"] = subject
-            message["From"] = f"{self.from_name} <{self.from_email}>"
-            message["To"] = ", ".join(self.to_emails)
-            if self.cc_emails:
-                message["Cc"] = ", ".join(self.cc_emails)
-            
-            # Attach both plain text and HTML versions
-            message.attach(MIMEText(text_body, "plain"))
-            message.attach(MIMEText(html_body, "html"))
-            
-            # Send email in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self._send_email, message)
-            
-            logger.info(f"Email alert sent: {alert.alert_id}")
+            self._send_queue.put_nowait((alert, derived, delivered))
+        except asyncio.QueueFull:
+            logger.warning(f"Email queue full, dropping alert: {alert.alert_id}")
+            return False
+        
+        self._remember(key)
+        await self.start()
+        if delivered is None:
+            return True
+        return await delivered
+    
+    def _build_message(self, alert: Alert, derived: _Derived) -> bytes:
+        """Build the email message for an alert, serialized once for sending."""
+        # Build email content
+        subject = self._build_subject(alert, derived)
+        html_body = self._build_html_body(alert, derived)
+        text_body = self._build_text_body(alert, derived)
+        
+        # Create message
+        message = EmailMessage(policy=policy.SMTP)
+        message["Subject"] = subject
+        message["From"] = self._from_header
+        message["To"] = self._to_header
+        if self._cc_header:
+            message["Cc"] = self._cc_header
+        
+        # Plain text body with an HTML alternative. The bodies carry
+        # non-ASCII (emoji), so they are base64-encoded as MIMEText did;
+        # the default 8bit would need BODY=8BITMIME, which sendmail never
+        # requests and not every relay supports.
+        message.set_content(text_body, cte="base64")
+        message.add_alternative(html_body, subtype="html", cte="base64")
+        
+        buffer = io.BytesIO()
+        BytesGenerator(buffer, policy=policy.SMTP).flatten(message)
+        return buffer.getvalue()
+    
+    def _dedupe_key(self, alert: Alert) -> tuple:
+        """Key identifying repeats of the same alert."""
+        return (alert.alert_type, alert.source, alert.related_entity_id, alert.title)
+    
+    def _is_duplicate(self, key: tuple) -> bool:
+        """Check whether an identical alert was sent within dedupe_window."""
+        if not self.dedupe_window:
+            return False
+        
+        sent_at = self._recent.get(key)
+        return sent_at is not None and time.monotonic() - sent_at < self.dedupe_window
+    
+    def _remember(self, key: tuple) -> None:
+        """Record an alert as sent once it has been accepted for sending."""
+        if not self.dedupe_window:
+            return
+        
+        # Re-insert so the dict stays ordered by send time, then drop
+        # expired (or, past MAX_DEDUPE_ENTRIES, oldest) entries from the front
+        now = time.monotonic()
+        self._recent.pop(key, None)
+        self._recent[key] = now
+        while True:
+            oldest = next(iter(self._recent))
+            if (now - self._recent[oldest] < self.dedupe_window
+                    and len(self._recent) <= self.MAX_DEDUPE_ENTRIES):
+                break
+            del self._recent[oldest]
+    
+    def _allow_severity(self, severity: str) -> bool:
+        """
+        Check and count an alert against its severity's sliding window.
+        
+        Approximates a sliding log by weighting the previous fixed window's
+        count by how much of it still overlaps the sliding window.
+        """
+        limit = self._severity_limits.get(severity)
+        if limit is None:
             return True
+        
+        window = self.SEVERITY_RATE_WINDOW
+        now = time.monotonic()
+        prev, curr, start = self._windows.get(severity, (0, 0, now))
+        elapsed = now - start
+        if elapsed >= window:
+            # The previous window only counts if it was the one just ended
+            prev = curr if elapsed < 2 * window else 0
+            curr = 0
+            start += window * (elapsed // window)
+            elapsed = now - start
+        
+        allowed = prev * (1 - elapsed / window) + curr < limit
+        self._windows[severity] = (prev, curr + 1 if allowed else curr, start)
+        return allowed
+    
+    async def start(self):
+        """Start the background send worker (also started by the first send)."""
+        if self._send_worker_task is None or self._send_worker_task.done():
+            self._send_worker_task = asyncio.create_task(self._send_worker())
+    
+    async def flush(self):
+        """Wait until every queued alert has been processed."""
+        if self._send_worker_task and not self._send_worker_task.done():
+            await self._send_queue.join()
+    
+    async def _send_worker(self):
+        """
+        Background task that sends queued alerts in batches.
+        
+        Up to max_batch alerts are sent back-to-back over one connection
+        checkout, so a burst of alerts pays for connection setup once.
+        """
+        while True:
+            batch = [await self._send_queue.get()]
+            while len(batch) < self.max_batch and not self._send_queue.empty():
+                batch.append(self._send_queue.get_nowait())
             
+            try:
+                await self._send_alerts(batch)
+            finally:
+                for _, _, delivered in batch:
+                    # Anything left unresolved was not sent
+                    if delivered is not None and not delivered.done():
+                        delivered.set_result(False)
+                    self._send_queue.task_done()
+    
+    async def _send_alerts(
+        self,
+        batch: List[Tuple[Alert, _Derived, Optional[asyncio.Future]]],
+    ):
+        """Build and send a batch of queued alerts, reporting each result."""
+        sent = []
+        messages = []
+        for alert, derived, delivered in batch:
+            try:
+                messages.append(self._build_message(alert, derived))
+                sent.append((alert.alert_id, delivered))
+            except Exception as e:
+                logger.error(f"Failed to build email alert {alert.alert_id}: {e}")
+        
+        if not messages:
+            return
+        
+        try:
+            if AIOSMTPLIB_AVAILABLE:
+                errors = await self._send_batch_async(messages)
+            else:
+                # Send email in thread pool to avoid blocking
+                loop = asyncio.get_event_loop()
+                errors = await loop.run_in_executor(self._executor, self._send_batch, messages)
         except Exception as e:
-            logger.error(f"Failed to send email alert: {e}")
-            return False
+            errors = [e] * len(messages)
+        
+        for (alert_id, delivered), error in zip(sent, errors):
+            if error is None:
+                logger.info(f"Email alert sent: {alert_id}")
+            else:
+                logger.error(f"Failed to send email alert {alert_id}: {error}")
+            if delivered is not None and not delivered.done():
+                delivered.set_result(error is None)
+    
+    async def close(self):
+        """Send queued alerts, stop the worker and close the SMTP connection."""
+        await self.flush()
+        if self._send_worker_task:
+            self._send_worker_task.cancel()
+            try:
+                await self._send_worker_task
+            except asyncio.CancelledError:
+                pass
+            self._send_worker_task = None
+        
+        async with self._async_smtp_lock:
+            await self._drop_async_connection()
+        
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(self._executor, self._close_connection)
+        self._executor.shutdown(wait=False)
+    
+    async def _get_async_connection(self) -> "aiosmtplib.SMTP":
+        """
+        Get the shared aiosmtplib connection, reconnecting if it has gone stale.
+        
+        Must be called with _async_smtp_lock held.
+        """
+        if self._async_smtp is not None:
+            try:
+                await self._async_smtp.noop()
+                return self._async_smtp
+            except (aiosmtplib.SMTPException, OSError):
+                await self._drop_async_connection()
+        
+        smtp = aiosmtplib.SMTP(
+            hostname=self.smtp_host,
+            port=self.smtp_port,
+            local_hostname=self._local_hostname,
+            use_tls=self.use_ssl,
+            start_tls=self.use_tls and not self.use_ssl,
+            tls_context=self._ssl_context,
+        )
+        await smtp.connect()
+        if self.smtp_user and self.smtp_password:
+            await smtp.login(self.smtp_user, self.smtp_password)
+        
+        self._async_smtp = smtp
+        return smtp
     
-    def _send_email(self, message: MIMEMultipart):
-        """Send email via SMTP (blocking operation)."""
-        all_recipients = self.to_emails + self.cc_emails
+    async def _drop_async_connection(self):
+        """Discard the shared aiosmtplib connection, ending the session if possible."""
+        smtp, self._async_smtp = self._async_smtp, None
+        if smtp is None:
+            return
+        try:
+            await smtp.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            smtp.close()
+    
+    async def _send_batch_async(self, messages: List[bytes]) -> List[Optional[Exception]]:
+        """
+        Send messages via aiosmtplib on the event loop.
+        
+        Returns:
+            The error for each message, or None if it was sent
+        """
+        errors: List[Optional[Exception]] = []
+        smtp = None
+        
+        async with self._async_smtp_lock:
+            for message in messages:
+                try:
+                    # The connection is checked once per batch, not per message
+                    if smtp is None:
+                        smtp = await self._get_async_connection()
+                    await smtp.sendmail(self.from_email, self._all_recipients, message)
+                    errors.append(None)
+                except (aiosmtplib.SMTPServerDisconnected, OSError) as e:
+                    # Reconnect for the next message rather than reusing a broken session
+                    await self._drop_async_connection()
+                    smtp = None
+                    errors.append(e)
+                except aiosmtplib.SMTPException as e:
+                    # Clear the failed transaction so the session stays usable
+                    if smtp is not None:
+                        try:
+                            await smtp.rset()
+                        except (aiosmtplib.SMTPException, OSError):
+                            await self._drop_async_connection()
+                            smtp = None
+                    errors.append(e)
         
+        return errors
+    
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate a new SMTP connection (blocking)."""
         if self.use_ssl:
-            context = ssl.create_default_context()
-            with smtplib.SMTP_SSL(self.smtp_host, self.smtp_port, context=context) as server:
-                if self.smtp_user and self.smtp_password:
-                    server.login(self.smtp_user, self.smtp_password)
-                server.sendmail(self.from_email, all_recipients, message.as_string())
+            server = smtplib.SMTP_SSL(
+                self.smtp_host, self.smtp_port,
+                local_hostname=self._local_hostname, context=self._ssl_context
+            )
+        else:
+            server = smtplib.SMTP(
+                self.smtp_host, self.smtp_port, local_hostname=self._local_hostname
+            )
+            if self.use_tls:
+                server.starttls(context=self._ssl_context)
+        
+        if self.smtp_user and self.smtp_password:
+            server.login(self.smtp_user, self.smtp_password)
+        return server
+    
+    def _get_connection(self) -> smtplib.SMTP:
+        """
+        Get the shared SMTP connection, reconnecting if it has gone stale.
+        
+        Must be called with _smtp_lock held.
+        """
+        if self._smtp is not None:
+            try:
+                self._smtp.noop()
+                return self._smtp
+            except (smtplib.SMTPException, OSError):
+                self._drop_connection()
+        
+        self._smtp = self._connect()
+        return self._smtp
+    
+    def _drop_connection(self):
+        """Discard the shared connection, ending the session if possible."""
+        server, self._smtp = self._smtp, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+    
+    def _close_connection(self):
+        """Close the shared connection (blocking)."""
+        with self._smtp_lock:
+            self._drop_connection()
+    
+    def _send_batch(self, messages: List[bytes]) -> List[Optional[Exception]]:
+        """
+        Send messages via SMTP (blocking operation).
+        
+        Returns:
+            The error for each message, or None if it was sent
+        """
+        errors: List[Optional[Exception]] = []
+        server = None
+        
+        with self._smtp_lock:
+            for message in messages:
+                try:
+                    # The connection is checked once per batch, not per message
+                    if server is None:
+                        server = self._get_connection()
+                    server.sendmail(self.from_email, self._all_recipients, message)
+                    errors.append(None)
+                except smtplib.SMTPServerDisconnected as e:
+                    # Reconnect for the next message rather than reusing a broken session
+                    self._drop_connection()
+                    server = None
+                    errors.append(e)
+                except smtplib.SMTPException as e:
+                    # Clear the failed transaction so the session stays usable
+                    if server is not None:
+                        try:
+                            server.rset()
+                        except OSError:
+                            self._drop_connection()
+                            server = None
+                    errors.append(e)
+                except OSError as e:
+                    self._drop_connection()
+                    server = None
+                    errors.append(e)
+        
+        return errors
+    
+    def _derive(self, alert: Alert) -> _Derived:
+        """Compute the severity, color and timestamp strings for an alert."""
+        severity = getattr(alert.severity, "value", None)
+        if severity is None:
+            severity = str(alert.severity)
+        if isinstance(alert.timestamp, datetime):
+            # Same text as strftime("%Y-%m-%d %H:%M:%S UTC") without parsing
+            # a format string; the slice drops any UTC offset
+            timestamp = alert.timestamp.isoformat(" ", "seconds")[:19] + " UTC"
+        else:
+            timestamp = str(alert.timestamp)
+        if type(alert.severity) is AlertSeverity:
+            color = self.SEVERITY_COLORS_BY_ENUM[alert.severity]
         else:
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                if self.use_tls:
-                    context = ssl.create_default_context()
-                    server.starttls(context=context)
-                if self.smtp_user and self.smtp_password:
-                    server.login(self.smtp_user, self.smtp_password)
-                server.sendmail(self.from_email, all_recipients, message.as_string())
-    
-    def _build_subject(self, alert: Alert) -> str:
+            color = self.SEVERITY_COLORS.get(severity, "#6c757d")
+        return _Derived(
+            severity=severity,
+            severity_upper=severity.upper(),
+            color=color,
+            timestamp=timestamp,
+        )
+    
+    def _build_subject(self, alert: Alert, derived: _Derived) -> str:
         """Build email subject line."""
-        severity = alert.severity.value if hasattr(alert.severity, 'value') else str(alert.severity)
-        return f"[{severity.upper()}] PredictBot Alert: {alert.title}"
+        return f"[{derived.severity_upper}] PredictBot Alert: {alert.title}"
     
-    def _build_text_body(self, alert: Alert) -> str:
+    def _build_text_body(self, alert: Alert, derived: _Derived) -> str:
         """Build plain text email body."""
-        severity = alert.severity.value if hasattr(alert.severity, 'value') else str(alert.severity)
-        timestamp = alert.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC") if isinstance(alert.timestamp, datetime) else str(alert.timestamp)
-        
-        lines = [
-            f"PredictBot Alert",
-            f"=" * 50,
-            f"",
-            f"Alert ID: {alert.alert_id}",
-            f"Severity: {severity.upper()}",
-            f"Type: {alert.alert_type}",
-            f"Time: {timestamp}",
-            f"Source: {alert.source}",
-            f"",
-            f"Title: {alert.title}",
-            f"",
-            f"Message:",
-            f"{alert.message}",
-            f"",
-        ]
         
+        entity_block = ""
         if alert.related_entity_type:
-            lines.append(f"Related Entity: {alert.related_entity_type}")
+            entity_block += f"Related Entity: {alert.related_entity_type}\n"
         if alert.related_entity_id:
-            lines.append(f"Entity ID: {alert.related_entity_id}")
+            entity_block += f"Entity ID: {alert.related_entity_id}\n"
         
+        metadata_block = ""
         if alert.metadata:
-            lines.append("")
-            lines.append("Additional Details:")
-            for key, value in alert.metadata.items():
-                lines.append(f"  {key}: {value}")
+            metadata_block = "\nAdditional Details:\n" + "".join(
+                f"  {key}: {value}\n" for key, value in alert.metadata.items()
+            )
         
-        lines.extend([
-            "",
-            "-" * 50,
-            "This is an automated alert from PredictBot.",
-            "Do not reply to this email.",
-        ])
-        
-        return "\n".join(lines)
+        return _TEXT_TEMPLATE.format(
+            alert_id=alert.alert_id,
+            severity_upper=derived.severity_upper,
+            alert_type=alert.alert_type,
+            timestamp=derived.timestamp,
+            source=alert.source,
+            title=alert.title,
+            message=alert.message,
+            entity_block=entity_block,
+            metadata_block=metadata_block,
+        )
     
-    def _build_html_body(self, alert: Alert) -> str:
+    def _build_html_body(self, alert: Alert, derived: _Derived) -> str:
         """Build HTML email body."""
-        severity = alert.severity.value if hasattr(alert.severity, 'value') else str(alert.severity)
-        color = self.SEVERITY_COLORS.get(severity, "#6c757d")
-        timestamp = alert.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC") if isinstance(alert.timestamp, datetime) else str(alert.timestamp)
         
         # Try to load template for specific alert type
         template = self._load_template(alert.alert_type)
         if template:
-            return self._render_template(template, alert)
+            return self._render_template(template, alert, derived)
         
         # Default HTML template
         metadata_html = ""
         if alert.metadata:
-            metadata_rows = "".join([
-                f"<tr><td style='padding: 8px; border-bottom: 1px solid #eee;'><strong>{k}</strong></td>"
-                f"<td style='padding: 8px; border-bottom: 1px solid #eee;'>{v}</td></tr>"
+            metadata_html = _METADATA_SECTION_TEMPLATE.format(rows="".join(
+                _METADATA_ROW_TEMPLATE.format(key=_esc(str(k)), value=_esc(str(v)))
                 for k, v in alert.metadata.items()
-            ])
-            metadata_html = f"""
-            <h3 style="color: #333; margin-top: 20px;">Additional Details</h3>
-            <table style="width: 100%; border-collapse: collapse;">
-                {metadata_rows}
-            </table>
-            """
+            ))
         
         entity_html = ""
         if alert.related_entity_type or alert.related_entity_id:
-            entity_html = f"""
-            <p style="color: #666; font-size: 14px;">
-                Related: {alert.related_entity_type or 'N/A'} 
-                {f'(ID: {alert.related_entity_id})' if alert.related_entity_id else ''}
-            </p>
-            """
+            entity_html = _ENTITY_TEMPLATE.format(
+                entity_type=alert.related_entity_type or 'N/A',
+                entity_id=f'(ID: {alert.related_entity_id})' if alert.related_entity_id else '',
+            )
         
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        </head>
-        <body style="font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
-            <div style="background: linear-gradient(135deg, {color} 0%, {color}dd 100%); color: white; padding: 20px; border-radius: 8px 8px 0 0;">
-                <h1 style="margin: 0; font-size: 24px;">⚠️ PredictBot Alert</h1>
-                <p style="margin: 5px 0 0 0; opacity: 0.9;">{severity.upper()} - {alert.alert_type}</p>
-            </div>
-            
-            <div style="background: #f8f9fa; padding: 20px; border: 1px solid #dee2e6; border-top: none;">
-                <table style="width: 100%; font-size: 14px;">
-                    <tr>
-                        <td style="padding: 5px 0;"><strong>Alert ID:</strong></td>
-                        <td style="padding: 5px 0;">{alert.alert_id}</td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 5px 0;"><strong>Time:</strong></td>
-                        <td style="padding: 5px 0;">{timestamp}</td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 5px 0;"><strong>Source:</strong></td>
-                        <td style="padding: 5px 0;">{alert.source}</td>
-                    </tr>
-                </table>
-            </div>
-            
-            <div style="background: white; padding: 20px; border: 1px solid #dee2e6; border-top: none; border-radius: 0 0 8px 8px;">
-                <h2 style="color: #333; margin-top: 0;">{alert.title}</h2>
-                <p style="color: #555; font-size: 16px;">{alert.message}</p>
-                {entity_html}
-                {metadata_html}
-            </div>
-            
-            <div style="text-align: center; padding: 20px; color: #999; font-size: 12px;">
-                <p>This is an automated alert from PredictBot Trading System.</p>
-                <p>Do not reply to this email.</p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        return html
+        return _DEFAULT_HTML_TEMPLATE.format(
+            color=derived.color,
+            severity_upper=derived.severity_upper,
+            alert_type=alert.alert_type,
+            alert_id=alert.alert_id,
+            timestamp=derived.timestamp,
+            source=alert.source,
+            title=alert.title,
+            message=alert.message,
+            entity_html=entity_html,
+            metadata_html=metadata_html,
+        )
     
-    def _load_template(self, alert_type: str) -> Optional[str]:
-        """Load HTML template for alert type."""
-        if alert_type in self._template_cache:
-            return self._template_cache[alert_type]
-        
-        # Convert alert type to filename
-        filename = f"{alert_type.replace('.', '_')}.html"
-        template_path = self.template_dir / filename
+    def _load_templates(self) -> Dict[str, str]:
+        """Read and compile every HTML template in template_dir."""
+        templates: Dict[str, str] = {}
+        if not self.template_dir.is_dir():
+            return templates
         
-        if template_path.exists():
+        for template_path in self.template_dir.glob("*.html"):
             try:
-                template = template_path.read_text()
-                self._template_cache[alert_type] = template
-                return template
+                templates[template_path.stem] = _compile_template(template_path.read_text())
             except Exception as e:
-                logger.warning(f"Failed to load template {filename}: {e}")
+                logger.warning(f"Failed to load template {template_path.name}: {e}")
         
-        return None
+        return templates
+    
+    def _load_template(self, alert_type: str) -> Optional[str]:
+        """Get the compiled HTML template for an alert type."""
+        # Alert types map to filenames with dots replaced by underscores
+        return self._template_cache.get(alert_type.replace(".", "_"))
     
-    def _render_template(self, template: str, alert: Alert) -> str:
+    def _render_template(self, template: str, alert: Alert, derived: _Derived) -> str:
         """Render template with alert data."""
-        severity = alert.severity.value if hasattr(alert.severity, 'value') else str(alert.severity)
-        timestamp = alert.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC") if isinstance(alert.timestamp, datetime) else str(alert.timestamp)
         
         # Build metadata string
         metadata_str = ""
         if alert.metadata:
-            metadata_str = "<br>".join([f"<strong>{k}:</strong> {v}" for k, v in alert.metadata.items()])
+            metadata_str = "<br>".join(
+                f"<strong>{_esc(str(k))}:</strong> {_esc(str(v))}"
+                for k, v in alert.metadata.items()
+            )
         
         # Template variables
-        variables = {
+        variables = _TemplateVars({
             "alert_id": alert.alert_id,
             "alert_type": alert.alert_type,
-            "severity": severity,
-            "severity_upper": severity.upper(),
-            "severity_color": self.SEVERITY_COLORS.get(severity, "#6c757d"),
+            "severity": derived.severity,
+            "severity_upper": derived.severity_upper,
+            "severity_color": derived.color,
             "title": alert.title,
             "message": alert.message,
             "source": alert.source,
-            "timestamp": timestamp,
+            "timestamp": derived.timestamp,
             "related_entity_type": alert.related_entity_type or "",
             "related_entity_id": alert.related_entity_id or "",
             "metadata": metadata_str,
-        }
+        })
         
         # Add all metadata items as individual variables
         if alert.metadata:
@@ -318,33 +857,11 @@ class EmailNotifier:
                 variables[f"meta_{key}"] = value
         
         try:
-            return Template(template).safe_substitute(variables)
+            return template.format_map(variables)
         except Exception as e:
             logger.warning(f"Template rendering failed: {e}")
-            return self._build_html_body(alert)
+            return self._build_html_body(alert, derived)
     
     async def send_test_email(self) -> bool:
         """Send a test email to verify configuration."""
-        from dataclasses import dataclass
-        
-        @dataclass
-        class TestAlert:
-            alert_id: str = "test-001"
-            alert_type: str = "test"
-            severity: str = "info"
-            title: str = "Test Alert"
-            message: str = "This is a test alert to verify email configuration."
-            source: str = "email-notifier"
-            timestamp: datetime = None
-            related_entity_type: str = None
-            related_entity_id: str = None
-            metadata: dict = None
-            
-            def __post_init__(self):
-                if self.timestamp is None:
-                    self.timestamp = datetime.utcnow()
-                if self.metadata is None:
-                    self.metadata = {"test_key": "test_value"}
-        
-        test_alert = TestAlert()
-        return await self.send_alert(test_alert)
+        return await self.send_alert(_TestAlert(), wait=True)
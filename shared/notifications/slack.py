@@ -6,13 +6,41 @@ Uses Slack Block Kit for structured, interactive messages.
 """
 
 import asyncio
+import heapq
+import itertools
+import json
 import logging
+import random
 import aiohttp
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a value to JSON bytes, preferring orjson."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value)
+    return json.dumps(value).encode()
+
+
+def _retry_after(headers: Any) -> float:
+    """Read the Retry-After delay (seconds) from a rate-limited response."""
+    try:
+        return max(float(headers.get("Retry-After", 1)), 0.0)
+    except (TypeError, ValueError):
+        return 1.0
+
 # Import Alert type for type hints
 try:
     from ..alert_service import Alert
@@ -21,6 +49,34 @@ except ImportError:
     Alert = Any
     AlertSeverity = Any
 
+# Shared Block Kit pieces; payloads are only serialized, never mutated
+_DIVIDER = {"type": "divider"}
+
+
+# Trade notification fields: format strings filled from the trade values
+_TRADE_FIELD_FORMATS = (
+    "*Market:*\n{market}",
+    "*Side:*\n{side}",
+    "*Quantity:*\n{quantity:,.4f}",
+    "*Price:*\n${price:,.4f}",
+)
+
+# Daily summary fields
+_SUMMARY_FIELD_FORMATS = (
+    "*Total Trades:*\n{total_trades}",
+    "*Winning Trades:*\n{winning_trades}",
+    "*Win Rate:*\n{win_rate:.1f}%",
+    "*Total P&L:*\n{pnl_emoji} ${total_pnl:+,.2f}",
+)
+
+
+def _header_block(text: str) -> Dict[str, Any]:
+    """Build a Block Kit header block."""
+    return {
+        "type": "header",
+        "text": {"type": "plain_text", "text": text, "emoji": True},
+    }
+
 
 class SlackNotifier:
     """
@@ -30,23 +86,21 @@ class SlackNotifier:
     severity-based colors, and action buttons.
     """
     
-    # Severity to color mapping (Slack uses hex colors)
-    SEVERITY_COLORS = {
-        "critical": "#dc3545",  # Red
-        "high": "#fd7e14",      # Orange
-        "medium": "#ffc107",    # Yellow
-        "low": "#17a2b8",       # Cyan
-        "info": "#6c757d",      # Gray
+    # Severity to (color, emoji) mapping (Slack uses hex colors)
+    SEVERITY_META = {
+        "critical": ("#dc3545", "🚨"),  # Red
+        "high": ("#fd7e14", "⚠️"),      # Orange
+        "medium": ("#ffc107", "📢"),    # Yellow
+        "low": ("#17a2b8", "ℹ️"),       # Cyan
+        "info": ("#6c757d", "📝"),      # Gray
     }
+    DEFAULT_SEVERITY_META = ("#6c757d", "📢")
     
-    # Severity to emoji mapping
-    SEVERITY_EMOJIS = {
-        "critical": "🚨",
-        "high": "⚠️",
-        "medium": "📢",
-        "low": "ℹ️",
-        "info": "📝",
-    }
+    SEVERITY_COLORS = {k: meta[0] for k, meta in SEVERITY_META.items()}
+    SEVERITY_EMOJIS = {k: meta[1] for k, meta in SEVERITY_META.items()}
+    
+    # Queue priority by severity (lower is more urgent)
+    SEVERITY_RANK = {k: rank for rank, k in enumerate(SEVERITY_META)}
     
     def __init__(self, config: Dict[str, Any]):
         """
@@ -60,6 +114,14 @@ class SlackNotifier:
                 - icon_emoji: Bot icon emoji (optional)
                 - mention_users: List of user IDs to mention for critical alerts
                 - mention_channel: Whether to @channel for critical alerts
+                - max_retries: Retries for rate-limited (429) and 5xx
+                  responses and connection failures (default 2)
+                - queue_size: Maximum alerts held by send_alert_nowait
+                  (default 1000)
+                - coalesce_window: Seconds during which repeats of an alert
+                  (same type, source, entity and severity) are counted instead of
+                  sent; a summary follows if any repeated (default 5, 0
+                  disables)
         """
         self.webhook_url = config.get("webhook_url")
         self.channel = config.get("channel")
@@ -68,6 +130,96 @@ class SlackNotifier:
         self.mention_users = config.get("mention_users", [])
         self.mention_channel = config.get("mention_channel", False)
         self.timeout = config.get("timeout", 10)
+        self.max_retries = config.get("max_retries", 2)
+        
+        # Identity fields shared by every payload
+        self._base_payload: Dict[str, Any] = {
+            "username": self.username,
+            "icon_emoji": self.icon_emoji,
+        }
+        if self.channel:
+            self._base_payload["channel"] = self.channel
+        
+        # Mention prefix for critical alerts, built once
+        if self.mention_channel:
+            self._critical_mentions = "<!channel> "
+        elif self.mention_users:
+            self._critical_mentions = " ".join(f"<@{uid}>" for uid in self.mention_users) + " "
+        else:
+            self._critical_mentions = ""
+        
+        # Shared HTTP session (created lazily, see close())
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Alerts queued by send_alert_nowait as a heap of
+        # (severity rank, sequence, alert), drained by a background task
+        self.queue_size = config.get("queue_size", 1000)
+        self._pending: List[tuple] = []
+        self._sequence = itertools.count()
+        self._pending_ready = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._drainer: Optional[asyncio.Task] = None
+        
+        # Alert bursts being coalesced: key -> [count, first alert, timer task]
+        self.coalesce_window = config.get("coalesce_window", 5.0)
+        self._bursts: Dict[tuple, list] = {}
+    
+    async def __aenter__(self) -> "SlackNotifier":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get or create the shared HTTP session for webhook requests.
+        
+        aiohttp speaks HTTP/1.1 only, so concurrent posts (see send_alerts)
+        spread over a small pool of kept-alive connections rather than being
+        multiplexed on one.
+        """
+        if self._session is None or self._session.closed:
+            # The session-level timeout applies to every request. Alerts are
+            # infrequent and all go to one host, so idle connections are kept
+            # well past aiohttp's 15s default to avoid a TLS handshake per alert.
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(
+                    limit=8,
+                    limit_per_host=4,
+                    keepalive_timeout=300,
+                    ttl_dns_cache=600,
+                    force_close=False,
+                ),
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        """Deliver queued alerts and close the HTTP session. Call on shutdown."""
+        await self.flush()
+        
+        # Send pending burst summaries now rather than waiting out the window.
+        # A timer can end a burst while an earlier summary is being sent, so
+        # each key is re-checked.
+        for key in list(self._bursts):
+            burst = self._bursts.pop(key, None)
+            if burst is None:
+                continue
+            burst[2].cancel()
+            await self._send_burst_summary(burst)
+        
+        if self._drainer:
+            self._drainer.cancel()
+            try:
+                await self._drainer
+            except asyncio.CancelledError:
+                pass
+            self._drainer = None
+        
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
     
     async def send_alert(self, alert: Alert) -> bool:
         """
@@ -83,72 +235,213 @@ class SlackNotifier:
             logger.warning("Slack webhook URL not configured")
             return False
         
+        if self.coalesce_window and self._coalesce(alert):
+            logger.debug(f"Coalesced repeated Slack alert: {alert.alert_id}")
+            return True
+        
+        return await self._send(alert)
+    
+    async def _send(self, alert: Alert, suffix: str = "") -> bool:
+        """Build and POST an alert payload."""
         try:
-            payload = self._build_payload(alert)
+            payload = self._build_payload(alert, suffix)
+        except Exception as e:
+            logger.error(f"Failed to send Slack alert: {e}")
+            return False
+        
+        sent = await self._post(payload)
+        if sent:
+            logger.info(f"Slack alert sent: {alert.alert_id}")
+        return sent
+    
+    def _coalesce(self, alert: Alert) -> bool:
+        """
+        Count an alert against its burst.
+        
+        Returns:
+            True if the alert repeats one sent within coalesce_window and
+            should not be sent on its own
+        """
+        # Severity is part of the key so an escalation is never folded
+        # into a burst of lower-severity repeats
+        key = (alert.alert_type, alert.source, alert.related_entity_id, str(alert.severity))
+        burst = self._bursts.get(key)
+        if burst is not None:
+            burst[0] += 1
+            return True
+        
+        timer = asyncio.create_task(self._burst_timer(key))
+        self._bursts[key] = [1, alert, timer]
+        return False
+    
+    async def _burst_timer(self, key: tuple) -> None:
+        """Close a burst once its coalesce window has elapsed."""
+        await asyncio.sleep(self.coalesce_window)
+        await self._end_burst(key)
+    
+    async def _end_burst(self, key: tuple) -> None:
+        """Forget a burst, sending a summary if the alert repeated."""
+        burst = self._bursts.pop(key, None)
+        if burst is not None:
+            await self._send_burst_summary(burst)
+    
+    async def _send_burst_summary(self, burst: list) -> None:
+        """Send a summary for a finished burst if the alert repeated."""
+        count, alert, _ = burst
+        if count > 1:
+            await self._send(alert, f"\n_(occurred {count} times)_")
+    
+    def send_alert_nowait(self, alert: Alert) -> bool:
+        """
+        Queue an alert for background delivery and return immediately.
+        
+        Queued alerts are sent most severe first. When the queue is full the
+        least severe alert (queued or new) is dropped.
+        
+        Args:
+            alert: The alert to send
             
-            async with aiohttp.ClientSession() as session:
+        Returns:
+            True if the alert was queued
+        """
+        if not self.webhook_url:
+            logger.warning("Slack webhook URL not configured")
+            return False
+        
+        severity = getattr(alert.severity, "value", None) or str(alert.severity)
+        entry = (self.SEVERITY_RANK.get(severity, len(self.SEVERITY_RANK)), next(self._sequence), alert)
+        if len(self._pending) >= self.queue_size:
+            # Least severe, most recently queued
+            dropped = max(self._pending)
+            if dropped[0] <= entry[0]:
+                logger.warning(f"Slack queue full, dropping alert: {alert.alert_id}")
+                return False
+            self._pending.remove(dropped)
+            heapq.heapify(self._pending)
+            logger.warning(f"Slack queue full, dropping alert: {dropped[2].alert_id}")
+        
+        heapq.heappush(self._pending, entry)
+        self._idle.clear()
+        self._pending_ready.set()
+        if self._drainer is None or self._drainer.done():
+            self._drainer = asyncio.create_task(self._drain())
+        return True
+    
+    async def flush(self) -> None:
+        """Wait until every alert queued by send_alert_nowait has been sent."""
+        if self._drainer and not self._drainer.done():
+            await self._idle.wait()
+    
+    async def _drain(self) -> None:
+        """Background task that sends alerts queued by send_alert_nowait."""
+        while True:
+            await self._pending_ready.wait()
+            while self._pending:
+                _, _, alert = heapq.heappop(self._pending)
+                await self.send_alert(alert)
+            self._pending_ready.clear()
+            self._idle.set()
+    
+    async def send_alerts(self, alerts: List[Alert]) -> List[bool]:
+        """
+        Send several alerts concurrently over the shared session.
+        
+        Args:
+            alerts: The alerts to send
+            
+        Returns:
+            Per-alert success, in the same order as alerts
+        """
+        if not self.webhook_url:
+            logger.warning("Slack webhook URL not configured")
+            return [False] * len(alerts)
+        
+        return list(await asyncio.gather(*(self.send_alert(alert) for alert in alerts)))
+    
+    async def _post(self, payload: Dict[str, Any]) -> bool:
+        """
+        POST a payload to the webhook, retrying transient failures.
+        
+        Rate-limited requests wait for Slack's Retry-After; server errors
+        and connection failures back off exponentially with jitter.
+        
+        Returns:
+            True if Slack accepted the message
+        """
+        body = _dumps(payload)
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                session = await self._get_session()
                 async with session.post(
-                    self.webhook_url,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
+                    self.webhook_url, data=body, headers=_JSON_HEADERS
                 ) as response:
                     if response.status == 200:
-                        logger.info(f"Slack alert sent: {alert.alert_id}")
                         return True
-                    else:
-                        text = await response.text()
-                        logger.error(f"Slack API error: {response.status} - {text}")
-                        return False
-                        
-        except asyncio.TimeoutError:
-            logger.error("Slack webhook request timed out")
-            return False
-        except Exception as e:
-            logger.error(f"Failed to send Slack alert: {e}")
-            return False
+                    
+                    text = await response.text()
+                if response.status == 429:
+                    delay = _retry_after(response.headers)
+                elif response.status >= 500:
+                    delay = min(2 ** attempt + random.random(), 10)
+                else:
+                    logger.error(f"Slack API error: {response.status} - {text}")
+                    return False
+                logger.warning(f"Slack API error: {response.status} - {text}")
+            except (asyncio.TimeoutError, aiohttp.ClientConnectorError) as e:
+                logger.warning(f"Slack webhook request failed: {e!r}")
+                delay = min(2 ** attempt + random.random(), 10)
+            except Exception as e:
+                logger.error(f"Failed to send Slack message: {e}")
+                return False
+            
+            if attempt < self.max_retries:
+                await asyncio.sleep(delay)
+        
+        logger.error(f"Slack webhook failed after {self.max_retries + 1} attempts")
+        return False
     
-    def _build_payload(self, alert: Alert) -> Dict[str, Any]:
-        """Build Slack message payload with Block Kit."""
-        severity = alert.severity.value if hasattr(alert.severity, 'value') else str(alert.severity)
-        color = self.SEVERITY_COLORS.get(severity, "#6c757d")
-        emoji = self.SEVERITY_EMOJIS.get(severity, "📢")
-        timestamp = alert.timestamp.strftime("%Y-%m-%d %H:%M:%S UTC") if isinstance(alert.timestamp, datetime) else str(alert.timestamp)
-        
-        # Build mention text for critical alerts
-        mention_text = ""
-        if severity == "critical":
-            if self.mention_channel:
-                mention_text = "<!channel> "
-            elif self.mention_users:
-                mentions = " ".join([f"<@{uid}>" for uid in self.mention_users])
-                mention_text = f"{mentions} "
+    def _build_payload(self, alert: Alert, suffix: str = "") -> Dict[str, Any]:
+        """
+        Build Slack message payload with Block Kit.
+        
+        Args:
+            alert: The alert to format
+            suffix: Text appended to the alert message
+        """
+        severity = getattr(alert.severity, "value", None)
+        if severity is None:
+            severity = str(alert.severity)
+        color, emoji = self.SEVERITY_META.get(severity, self.DEFAULT_SEVERITY_META)
+        if isinstance(alert.timestamp, datetime):
+            # Same text as strftime("%Y-%m-%d %H:%M:%S UTC") without parsing
+            # a format string; the slice drops any UTC offset
+            timestamp = alert.timestamp.isoformat(" ", "seconds")[:19] + " UTC"
+        else:
+            timestamp = str(alert.timestamp)
+        
+        severity_upper = severity.upper()
+        
+        # Mention users/channel on critical alerts
+        mention_text = self._critical_mentions if severity == "critical" else ""
         
         # Build blocks
         blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": f"{emoji} {alert.title}",
-                    "emoji": True
-                }
-            },
+            _header_block(f"{emoji} {alert.title}"),
             {
                 "type": "section",
                 "text": {
                     "type": "mrkdwn",
-                    "text": f"{mention_text}{alert.message}"
+                    "text": f"{mention_text}{alert.message}{suffix}"
                 }
             },
-            {
-                "type": "divider"
-            },
+            _DIVIDER,
             {
                 "type": "section",
                 "fields": [
                     {
                         "type": "mrkdwn",
-                        "text": f"*Severity:*\n{severity.upper()}"
+                        "text": f"*Severity:*\n{severity_upper}"
                     },
                     {
                         "type": "mrkdwn",
@@ -185,11 +478,11 @@ class SlackNotifier:
         # Add metadata if present
         if alert.metadata:
             metadata_lines = []
-            for key, value in list(alert.metadata.items())[:10]:  # Limit to 10 items
+            for key, value in itertools.islice(alert.metadata.items(), 10):  # Limit to 10 items
                 # Truncate long values
                 str_value = str(value)
                 if len(str_value) > 100:
-                    str_value = str_value[:97] + "..."
+                    str_value = f"{str_value[:97]}..."
                 metadata_lines.append(f"• *{key}:* {str_value}")
             
             if metadata_lines:
@@ -213,22 +506,16 @@ class SlackNotifier:
         })
         
         # Build payload
-        payload = {
-            "username": self.username,
-            "icon_emoji": self.icon_emoji,
+        return {
+            **self._base_payload,
             "blocks": blocks,
             "attachments": [
                 {
                     "color": color,
-                    "fallback": f"[{severity.upper()}] {alert.title}: {alert.message}"
+                    "fallback": f"[{severity_upper}] {alert.title}: {alert.message}"
                 }
             ]
         }
-        
-        if self.channel:
-            payload["channel"] = self.channel
-        
-        return payload
     
     async def send_simple_message(
         self,
@@ -251,20 +538,12 @@ class SlackNotifier:
             logger.warning("Slack webhook URL not configured")
             return False
         
-        color = self.SEVERITY_COLORS.get(severity, "#6c757d")
-        emoji = self.SEVERITY_EMOJIS.get(severity, "📢")
+        color, emoji = self.SEVERITY_META.get(severity, self.DEFAULT_SEVERITY_META)
         
         blocks = []
         
         if title:
-            blocks.append({
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": f"{emoji} {title}",
-                    "emoji": True
-                }
-            })
+            blocks.append(_header_block(f"{emoji} {title}"))
         
         blocks.append({
             "type": "section",
@@ -275,26 +554,12 @@ class SlackNotifier:
         })
         
         payload = {
-            "username": self.username,
-            "icon_emoji": self.icon_emoji,
+            **self._base_payload,
             "blocks": blocks,
             "attachments": [{"color": color}]
         }
         
-        if self.channel:
-            payload["channel"] = self.channel
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.webhook_url,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as response:
-                    return response.status == 200
-        except Exception as e:
-            logger.error(f"Failed to send Slack message: {e}")
-            return False
+        return await self._post(payload)
     
     async def send_trade_notification(
         self,
@@ -338,11 +603,10 @@ class SlackNotifier:
             color = "#6c757d"
         
         # Build fields
+        values = {"market": market, "side": side.upper(), "quantity": quantity, "price": price}
         fields = [
-            {"type": "mrkdwn", "text": f"*Market:*\n{market}"},
-            {"type": "mrkdwn", "text": f"*Side:*\n{side.upper()}"},
-            {"type": "mrkdwn", "text": f"*Quantity:*\n{quantity:,.4f}"},
-            {"type": "mrkdwn", "text": f"*Price:*\n${price:,.4f}"},
+            {"type": "mrkdwn", "text": fmt.format_map(values)}
+            for fmt in _TRADE_FIELD_FORMATS
         ]
         
         if pnl is not None:
@@ -353,14 +617,7 @@ class SlackNotifier:
             })
         
         blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": f"{emoji} Trade {trade_type.title()}",
-                    "emoji": True
-                }
-            },
+            _header_block(f"{emoji} Trade {trade_type.title()}"),
             {
                 "type": "section",
                 "fields": fields
@@ -368,26 +625,12 @@ class SlackNotifier:
         ]
         
         payload = {
-            "username": self.username,
-            "icon_emoji": self.icon_emoji,
+            **self._base_payload,
             "blocks": blocks,
             "attachments": [{"color": color}]
         }
         
-        if self.channel:
-            payload["channel"] = self.channel
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.webhook_url,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as response:
-                    return response.status == 200
-        except Exception as e:
-            logger.error(f"Failed to send trade notification: {e}")
-            return False
+        return await self._post(payload)
     
     async def send_daily_summary(
         self,
@@ -419,23 +662,21 @@ class SlackNotifier:
         
         pnl_emoji = "📈" if total_pnl >= 0 else "📉"
         color = "#28a745" if total_pnl >= 0 else "#dc3545"
+        values = {
+            "total_trades": total_trades,
+            "winning_trades": winning_trades,
+            "win_rate": win_rate,
+            "pnl_emoji": pnl_emoji,
+            "total_pnl": total_pnl,
+        }
         
         blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": f"📊 Daily Trading Summary - {date}",
-                    "emoji": True
-                }
-            },
+            _header_block(f"📊 Daily Trading Summary - {date}"),
             {
                 "type": "section",
                 "fields": [
-                    {"type": "mrkdwn", "text": f"*Total Trades:*\n{total_trades}"},
-                    {"type": "mrkdwn", "text": f"*Winning Trades:*\n{winning_trades}"},
-                    {"type": "mrkdwn", "text": f"*Win Rate:*\n{win_rate:.1f}%"},
-                    {"type": "mrkdwn", "text": f"*Total P&L:*\n{pnl_emoji} ${total_pnl:+,.2f}"},
+                    {"type": "mrkdwn", "text": fmt.format_map(values)}
+                    for fmt in _SUMMARY_FIELD_FORMATS
                 ]
             }
         ]
@@ -469,23 +710,9 @@ class SlackNotifier:
         })
         
         payload = {
-            "username": self.username,
-            "icon_emoji": self.icon_emoji,
+            **self._base_payload,
             "blocks": blocks,
             "attachments": [{"color": color}]
         }
         
-        if self.channel:
-            payload["channel"] = self.channel
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.webhook_url,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as response:
-                    return response.status == 200
-        except Exception as e:
-            logger.error(f"Failed to send daily summary: {e}")
-            return False
+        return await self._post(payload)
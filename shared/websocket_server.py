@@ -3,22 +3,86 @@ WebSocket Server for PredictBot Stack
 
 Provides real-time updates to connected clients via WebSocket.
 Integrates with the event bus for broadcasting events.
+
+The manager runs on whichever event loop the ASGI server provides; serve it
+with uvicorn[standard] (``--loop auto``, the default) to get uvloop.
+
+To use more than one core, run several server processes (``--workers N``),
+each with its own manager and EventBusWebSocketBridge. Redis pub/sub delivers
+every event to every worker, and each worker fans out to its own clients.
+Direct calls such as send_to_user only reach clients of the calling worker.
 """
 
 import asyncio
 import logging
 import json
+import time
 import uuid
 from datetime import datetime
-from typing import Dict, Any, Optional, Set, List, Callable
+from typing import Dict, Any, Optional, Set, List, Callable, Iterable, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
 from fastapi import WebSocket, WebSocketDisconnect, HTTPException, Depends
 from fastapi.websockets import WebSocketState
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+def _dumps(value: Any) -> bytes:
+    """Serialize a message to JSON bytes, preferring orjson."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value)
+    return json.dumps(value).encode()
+
+
+def _loads(data: Any) -> Any:
+    """Parse a JSON message from str or bytes, preferring orjson."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Exact client ping frames, answered without running the JSON parser
+_PING_FRAMES = frozenset(
+    form
+    for text in ('{"type":"ping"}', '{"type": "ping"}')
+    for form in (text, text.encode())
+)
+
+
+class _TimestampCache:
+    """ISO-8601 UTC timestamp reformatted at most once per millisecond."""
+    
+    __slots__ = ("_ms", "_value", "_second", "_prefix")
+    
+    def __init__(self):
+        self._ms = -1
+        self._value = ""
+        self._second = -1
+        self._prefix = ""
+    
+    def __call__(self) -> str:
+        ms = int(time.time() * 1000)
+        if ms != self._ms:
+            self._ms = ms
+            second, millis = divmod(ms, 1000)
+            # Only the fraction changes within a second
+            if second != self._second:
+                self._second = second
+                self._prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._value = f"{self._prefix}.{millis:03d}Z"
+        return self._value
+
+
+_utc_now_z = _TimestampCache()
+
 
 class MessageType(str, Enum):
     """Types of WebSocket messages."""
@@ -30,6 +94,7 @@ class MessageType(str, Enum):
     
     # Server -> Client
     EVENT = "event"
+    BATCH = "batch"
     SUBSCRIBED = "subscribed"
     UNSUBSCRIBED = "unsubscribed"
     PONG = "pong"
@@ -51,7 +116,7 @@ class SubscriptionChannel(str, Enum):
     MARKET_DATA = "market_data"
 
 
-@dataclass
+@dataclass(slots=True)
 class WebSocketClient:
     """Represents a connected WebSocket client."""
     id: str
@@ -62,6 +127,15 @@ class WebSocketClient:
     user_role: Optional[str] = None
     subscriptions: Set[str] = field(default_factory=set)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Binary frames skip text-frame UTF-8 handling; browsers must opt in
+    # (``?frames=binary``) since they receive them as Blobs.
+    binary_frames: bool = False
+    # Clients opting in (``?batch=1``) may receive several queued messages
+    # in one {"type": "batch", "messages": [...]} frame.
+    batch_frames: bool = False
+    send_queue: asyncio.Queue = field(default_factory=asyncio.Queue)
+    writer_task: Optional[asyncio.Task] = None
+    dropped_messages: int = 0
     
     def can_access_channel(self, channel: str) -> bool:
         """Check if client has permission to access a channel."""
@@ -93,7 +167,9 @@ class WebSocketManager:
         self,
         require_auth: bool = True,
         ping_interval: float = 30.0,
-        ping_timeout: float = 10.0
+        ping_timeout: float = 10.0,
+        max_batch: int = 32,
+        send_queue_size: int = 256
     ):
         """
         Initialize the WebSocket manager.
@@ -102,13 +178,23 @@ class WebSocketManager:
             require_auth: Whether authentication is required
             ping_interval: Interval between ping messages in seconds
             ping_timeout: Timeout for ping responses in seconds
+            max_batch: Maximum queued messages coalesced into one frame
+            send_queue_size: Per-client outgoing queue bound; the oldest
+                message is dropped when a slow client falls this far behind
         """
         self.require_auth = require_auth
         self.ping_interval = ping_interval
         self.ping_timeout = ping_timeout
+        self.max_batch = max_batch
+        self.send_queue_size = send_queue_size
         
         self.clients: Dict[str, WebSocketClient] = {}
         self.channel_subscribers: Dict[str, Set[str]] = {}
+        # channel -> channel subscribers plus "all" subscribers, kept in
+        # step with channel_subscribers so broadcasts need no set unions
+        self._effective_subscribers: Dict[str, Set[str]] = {}
+        # user_id -> IDs of that user's authenticated connections
+        self._user_clients: Dict[str, Set[str]] = {}
         
         # Authentication callback
         self._auth_callback: Optional[Callable] = None
@@ -116,6 +202,15 @@ class WebSocketManager:
         # Event handlers
         self._message_handlers: Dict[str, Callable] = {}
         
+        # Message type -> handler; built-ins take precedence over custom handlers
+        self._builtin_handlers: Dict[str, Callable] = {
+            MessageType.PING.value: self._handle_ping,
+            MessageType.AUTHENTICATE.value: self._handle_authenticate,
+            MessageType.SUBSCRIBE.value: self._handle_subscribe,
+            MessageType.UNSUBSCRIBE.value: self._handle_unsubscribe,
+        }
+        self._dispatch: Dict[str, Callable] = dict(self._builtin_handlers)
+        
         # Background tasks
         self._ping_task: Optional[asyncio.Task] = None
         self._running = False
@@ -127,6 +222,8 @@ class WebSocketManager:
     def add_message_handler(self, message_type: str, handler: Callable):
         """Add a handler for a specific message type."""
         self._message_handlers[message_type] = handler
+        if message_type not in self._builtin_handlers:
+            self._dispatch[message_type] = handler
     
     async def connect(self, websocket: WebSocket) -> WebSocketClient:
         """
@@ -144,10 +241,14 @@ class WebSocketManager:
         client = WebSocketClient(
             id=client_id,
             websocket=websocket,
-            authenticated=not self.require_auth
+            authenticated=not self.require_auth,
+            binary_frames=websocket.query_params.get("frames") == "binary",
+            batch_frames=websocket.query_params.get("batch") == "1",
+            send_queue=asyncio.Queue(maxsize=self.send_queue_size)
         )
         
         self.clients[client_id] = client
+        client.writer_task = asyncio.create_task(self._client_writer(client))
         
         # Send welcome message
         await self._send_message(client, {
@@ -155,7 +256,7 @@ class WebSocketManager:
             "client_id": client_id,
             "require_auth": self.require_auth,
             "available_channels": [c.value for c in SubscriptionChannel],
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": _utc_now_z()
         })
         
         logger.info(f"WebSocket client connected: {client_id}")
@@ -172,47 +273,47 @@ class WebSocketManager:
             return
         
         client = self.clients[client_id]
+        if client.writer_task:
+            client.writer_task.cancel()
         
         # Remove from all channel subscriptions
         for channel in client.subscriptions:
             if channel in self.channel_subscribers:
                 self.channel_subscribers[channel].discard(client_id)
+        for targets in self._effective_subscribers.values():
+            targets.discard(client_id)
+        self._unindex_user(client)
         
         del self.clients[client_id]
         logger.info(f"WebSocket client disconnected: {client_id}")
     
-    async def handle_message(self, client_id: str, data: str):
+    async def handle_message(self, client_id: str, data: Union[str, bytes]):
         """
         Handle an incoming message from a client.
         
         Args:
             client_id: ID of the sending client
-            data: Raw message data
+            data: Raw message data from a text or binary frame
         """
         if client_id not in self.clients:
             return
         
         client = self.clients[client_id]
         
+        if data in _PING_FRAMES:
+            await self._handle_ping(client)
+            return
+        
         try:
-            message = json.loads(data)
+            message = _loads(data)
+            if not isinstance(message, dict):
+                await self._send_error(client, "Message must be a JSON object")
+                return
             message_type = message.get("type")
             
-            if message_type == MessageType.PING.value:
-                await self._handle_ping(client)
-            
-            elif message_type == MessageType.AUTHENTICATE.value:
-                await self._handle_authenticate(client, message)
-            
-            elif message_type == MessageType.SUBSCRIBE.value:
-                await self._handle_subscribe(client, message)
-            
-            elif message_type == MessageType.UNSUBSCRIBE.value:
-                await self._handle_unsubscribe(client, message)
-            
-            elif message_type in self._message_handlers:
-                await self._message_handlers[message_type](client, message)
-            
+            handler = self._dispatch.get(message_type)
+            if handler:
+                await handler(client, message)
             else:
                 await self._send_error(client, f"Unknown message type: {message_type}")
                 
@@ -222,11 +323,11 @@ class WebSocketManager:
             logger.error(f"Error handling message: {e}")
             await self._send_error(client, str(e))
     
-    async def _handle_ping(self, client: WebSocketClient):
+    async def _handle_ping(self, client: WebSocketClient, message: Optional[Dict[str, Any]] = None):
         """Handle ping message."""
         await self._send_message(client, {
             "type": MessageType.PONG.value,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": _utc_now_z()
         })
     
     async def _handle_authenticate(self, client: WebSocketClient, message: Dict[str, Any]):
@@ -241,15 +342,18 @@ class WebSocketManager:
             try:
                 auth_result = await self._auth_callback(token)
                 if auth_result:
+                    self._unindex_user(client)
                     client.authenticated = True
                     client.user_id = auth_result.get("user_id")
                     client.user_role = auth_result.get("role")
+                    if client.user_id is not None:
+                        self._user_clients.setdefault(client.user_id, set()).add(client.id)
                     
                     await self._send_message(client, {
                         "type": MessageType.AUTHENTICATED.value,
                         "user_id": client.user_id,
                         "role": client.user_role,
-                        "timestamp": datetime.utcnow().isoformat() + "Z"
+                        "timestamp": _utc_now_z()
                     })
                     logger.info(f"Client {client.id} authenticated as {client.user_id}")
                 else:
@@ -262,7 +366,7 @@ class WebSocketManager:
             client.authenticated = True
             await self._send_message(client, {
                 "type": MessageType.AUTHENTICATED.value,
-                "timestamp": datetime.utcnow().isoformat() + "Z"
+                "timestamp": _utc_now_z()
             })
     
     async def _handle_subscribe(self, client: WebSocketClient, message: Dict[str, Any]):
@@ -285,17 +389,14 @@ class WebSocketManager:
             
             # Add subscription
             client.subscriptions.add(channel)
-            
-            if channel not in self.channel_subscribers:
-                self.channel_subscribers[channel] = set()
-            self.channel_subscribers[channel].add(client.id)
+            self._add_subscriber(client.id, channel)
             
             subscribed.append(channel)
         
         await self._send_message(client, {
             "type": MessageType.SUBSCRIBED.value,
             "channels": subscribed,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": _utc_now_z()
         })
         
         logger.debug(f"Client {client.id} subscribed to: {subscribed}")
@@ -311,18 +412,42 @@ class WebSocketManager:
         for channel in channels:
             if channel in client.subscriptions:
                 client.subscriptions.discard(channel)
-                
-                if channel in self.channel_subscribers:
-                    self.channel_subscribers[channel].discard(client.id)
-                
+                self._remove_subscriber(client.id, channel)
                 unsubscribed.append(channel)
         
         await self._send_message(client, {
             "type": MessageType.UNSUBSCRIBED.value,
             "channels": unsubscribed,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": _utc_now_z()
         })
     
+    def _add_subscriber(self, client_id: str, channel: str):
+        """Add a client to a channel and its effective subscriber sets."""
+        self.channel_subscribers.setdefault(channel, set()).add(client_id)
+        
+        if channel not in self._effective_subscribers:
+            self._effective_subscribers[channel] = set(
+                self.channel_subscribers.get("all", ())
+            )
+        self._effective_subscribers[channel].add(client_id)
+        
+        if channel == "all":
+            for targets in self._effective_subscribers.values():
+                targets.add(client_id)
+    
+    def _remove_subscriber(self, client_id: str, channel: str):
+        """Remove a client from a channel and its effective subscriber sets."""
+        if channel in self.channel_subscribers:
+            self.channel_subscribers[channel].discard(client_id)
+        
+        if channel == "all":
+            for name, targets in self._effective_subscribers.items():
+                if client_id not in self.channel_subscribers.get(name, ()):
+                    targets.discard(client_id)
+        elif client_id not in self.channel_subscribers.get("all", ()):
+            if channel in self._effective_subscribers:
+                self._effective_subscribers[channel].discard(client_id)
+    
     async def broadcast(
         self,
         channel: str,
@@ -339,32 +464,59 @@ class WebSocketManager:
             data: Event data
             exclude_clients: Set of client IDs to exclude
         """
-        if channel not in self.channel_subscribers:
+        if not self.has_subscribers(channel):
             return
         
-        message = {
+        await self.broadcast_prepared(
+            channel,
+            self.encode_event(channel, event_type, data),
+            exclude_clients
+        )
+    
+    def has_subscribers(self, channel: str) -> bool:
+        """Whether any client would receive a broadcast on a channel."""
+        return bool(
+            self.channel_subscribers.get(channel)
+            or self.channel_subscribers.get("all")
+        )
+    
+    def encode_event(self, channel: str, event_type: str, data: Dict[str, Any]) -> bytes:
+        """Serialize an event message for use with broadcast_prepared."""
+        return _dumps({
             "type": MessageType.EVENT.value,
             "channel": channel,
             "event_type": event_type,
             "data": data,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        
-        exclude = exclude_clients or set()
-        
-        # Also broadcast to "all" subscribers
-        all_subscribers = self.channel_subscribers.get("all", set())
-        channel_subscribers = self.channel_subscribers.get(channel, set())
+            "timestamp": _utc_now_z()
+        })
+    
+    async def broadcast_prepared(
+        self,
+        channel: str,
+        payload: bytes,
+        exclude_clients: Optional[Set[str]] = None
+    ):
+        """
+        Broadcast an already serialized message to all subscribers of a channel.
         
-        target_clients = (all_subscribers | channel_subscribers) - exclude
+        Args:
+            channel: Channel to broadcast to
+            payload: Serialized message, e.g. from encode_event
+            exclude_clients: Set of client IDs to exclude
+        """
+        # Channel subscribers plus "all" subscribers
+        target_clients = self._effective_subscribers.get(
+            channel, self.channel_subscribers.get("all", set())
+        )
+        if exclude_clients:
+            target_clients = target_clients - exclude_clients
+        if not target_clients:
+            return
         
-        for client_id in target_clients:
-            if client_id in self.clients:
-                client = self.clients[client_id]
-                try:
-                    await self._send_message(client, message)
-                except Exception as e:
-                    logger.warning(f"Failed to send to client {client_id}: {e}")
+        self._fan_out(
+            (self.clients[cid] for cid in target_clients if cid in self.clients),
+            payload
+        )
     
     async def broadcast_to_all(
         self,
@@ -378,19 +530,10 @@ class WebSocketManager:
             event_type: Type of event
             data: Event data
         """
-        message = {
-            "type": MessageType.EVENT.value,
-            "channel": "broadcast",
-            "event_type": event_type,
-            "data": data,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        
-        for client in self.clients.values():
-            try:
-                await self._send_message(client, message)
-            except Exception as e:
-                logger.warning(f"Failed to broadcast to client {client.id}: {e}")
+        self._fan_out(
+            self.clients.values(),
+            self.encode_event("broadcast", event_type, data)
+        )
     
     async def send_to_user(
         self,
@@ -406,32 +549,91 @@ class WebSocketManager:
             event_type: Type of event
             data: Event data
         """
-        message = {
-            "type": MessageType.EVENT.value,
-            "channel": "direct",
-            "event_type": event_type,
-            "data": data,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        
-        for client in self.clients.values():
-            if client.user_id == user_id:
-                try:
-                    await self._send_message(client, message)
-                except Exception as e:
-                    logger.warning(f"Failed to send to user {user_id}: {e}")
+        self._fan_out(
+            (self.clients[cid] for cid in self._user_clients.get(user_id, ())),
+            self.encode_event("direct", event_type, data)
+        )
+    
+    def _unindex_user(self, client: WebSocketClient):
+        """Drop a client from the user_id connection index."""
+        connections = self._user_clients.get(client.user_id)
+        if connections is not None:
+            connections.discard(client.id)
+            if not connections:
+                del self._user_clients[client.user_id]
+    
+    def _fan_out(self, clients: Iterable[WebSocketClient], payload: bytes):
+        """Queue one payload for every connected client, decoding it once."""
+        text = payload.decode()
+        for client in clients:
+            if client.websocket.client_state == WebSocketState.CONNECTED:
+                self._send_raw(client, payload, text)
     
     async def _send_message(self, client: WebSocketClient, message: Dict[str, Any]):
         """Send a message to a client."""
-        if client.websocket.client_state == WebSocketState.CONNECTED:
-            await client.websocket.send_json(message)
+        self._send_raw(client, _dumps(message))
+    
+    def _send_raw(self, client: WebSocketClient, payload: bytes, text: Optional[str] = None):
+        """
+        Queue a pre-serialized message for the client's writer task.
+        
+        Never waits on the socket, so fan-out loops call it directly and a
+        slow client only delays its own writer. Fan-outs pass the decoded
+        text once for all clients; otherwise it is decoded only when the
+        client uses text frames.
+        """
+        queue = client.send_queue
+        try:
+            queue.put_nowait((payload, text))
+        except asyncio.QueueFull:
+            # Slow consumer: drop the oldest message rather than grow memory
+            queue.get_nowait()
+            queue.put_nowait((payload, text))
+            client.dropped_messages += 1
+            logger.debug(f"Dropped message for slow client {client.id}")
+    
+    async def _client_writer(self, client: WebSocketClient):
+        """Drain a client's send queue, coalescing bursts into batch frames."""
+        queue = client.send_queue
+        websocket = client.websocket
+        
+        while True:
+            batch = [await queue.get()]
+            if client.batch_frames:
+                while not queue.empty() and len(batch) < self.max_batch:
+                    batch.append(queue.get_nowait())
+            
+            if len(batch) == 1:
+                payload, text = batch[0]
+            else:
+                payload = (
+                    b'{"type":"batch","messages":['
+                    + b",".join(item[0] for item in batch)
+                    + b"]}"
+                )
+                text = None
+            
+            if websocket.client_state != WebSocketState.CONNECTED:
+                continue
+            try:
+                if client.binary_frames:
+                    await websocket.send_bytes(payload)
+                else:
+                    await websocket.send_text(
+                        text if text is not None else payload.decode()
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to send to client {client.id}: {e}")
+                # Stop routing to a dead socket instead of failing per event
+                self.disconnect(client.id)
+                return
     
     async def _send_error(self, client: WebSocketClient, error: str):
         """Send an error message to a client."""
         await self._send_message(client, {
             "type": MessageType.ERROR.value,
             "error": error,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": _utc_now_z()
         })
     
     def get_stats(self) -> Dict[str, Any]:
@@ -442,11 +644,14 @@ class WebSocketManager:
         
         return {
             "total_connections": len(self.clients),
+            "dropped_messages": sum(
+                c.dropped_messages for c in self.clients.values()
+            ),
             "authenticated_connections": sum(
                 1 for c in self.clients.values() if c.authenticated
             ),
             "channel_subscribers": channel_stats,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": _utc_now_z()
         }
     
     async def start_ping_loop(self):
@@ -469,14 +674,11 @@ class WebSocketManager:
         while self._running:
             await asyncio.sleep(self.ping_interval)
             
-            for client_id, client in list(self.clients.items()):
-                try:
-                    await self._send_message(client, {
-                        "type": MessageType.PING.value,
-                        "timestamp": datetime.utcnow().isoformat() + "Z"
-                    })
-                except Exception as e:
-                    logger.warning(f"Ping failed for client {client_id}: {e}")
+            # One payload per tick, shared by every client
+            self._fan_out(self.clients.values(), _dumps({
+                "type": MessageType.PING.value,
+                "timestamp": _utc_now_z()
+            }))
 
 
 class EventBusWebSocketBridge:
@@ -500,6 +702,11 @@ class EventBusWebSocketBridge:
         "market.": SubscriptionChannel.MARKET_DATA.value,
     }
     
+    # Every prefix is "<word>.", so the text before the first dot is the key
+    _PREFIX_LOOKUP = {
+        prefix[:-1]: channel for prefix, channel in EVENT_CHANNEL_MAP.items()
+    }
+    
     def __init__(self, ws_manager: WebSocketManager):
         """
         Initialize the bridge.
@@ -531,24 +738,24 @@ class EventBusWebSocketBridge:
         # Determine channel based on event type
         channel = self._get_channel_for_event(event_type)
         
-        # Broadcast to WebSocket clients
-        await self.ws_manager.broadcast(
-            channel=channel,
-            event_type=event_type,
-            data={
-                "event_type": event_type,
-                "data": event.data,
-                "source": event.source_service,
-                "correlation_id": event.correlation_id,
-                "timestamp": event.timestamp
-            }
-        )
+        if not self.ws_manager.has_subscribers(channel):
+            return
+        
+        # Serialize once here; every subscriber receives the same bytes
+        payload = self.ws_manager.encode_event(channel, event_type, {
+            "event_type": event_type,
+            "data": event.data,
+            "source": event.source_service,
+            "correlation_id": event.correlation_id,
+            "timestamp": event.timestamp
+        })
+        await self.ws_manager.broadcast_prepared(channel, payload)
     
     def _get_channel_for_event(self, event_type: str) -> str:
         """Get the WebSocket channel for an event type."""
-        for prefix, channel in self.EVENT_CHANNEL_MAP.items():
-            if event_type.startswith(prefix):
-                return channel
+        head, dot, _ = event_type.partition(".")
+        if dot:
+            return self._PREFIX_LOOKUP.get(head, SubscriptionChannel.SYSTEM.value)
         return SubscriptionChannel.SYSTEM.value
 
 
@@ -569,7 +776,13 @@ async def websocket_endpoint(
     
     try:
         while True:
-            data = await websocket.receive_text()
+            # Binary frames go to the JSON parser as-is, without a UTF-8 decode
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            data = message.get("bytes")
+            if data is None:
+                data = message.get("text", "")
             await manager.handle_message(client.id, data)
     except WebSocketDisconnect:
         manager.disconnect(client.id)
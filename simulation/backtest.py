@@ -5,9 +5,10 @@ PredictBot Simulation - Backtest Engine
 Event-driven backtesting engine for prediction market strategies.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable, Generator
+from typing import Dict, List, Optional, Any, Callable, Deque, Generator
 from pathlib import Path
 import json
 import logging
@@ -323,6 +324,13 @@ class BacktestEngine:
         self._last_equity_record: Optional[datetime] = None
         self._slippage_sum = 0.0
         self._slippage_count = 0
+        self._equity_interval = timedelta(minutes=self.bt_config.record_equity_interval)
+        
+        # Exact event type -> handler, so the hot loop skips isinstance chains
+        self._event_handlers: Dict[type, Callable[[Any], None]] = {
+            MarketUpdateEvent: self._handle_market_update,
+            ResolutionEvent: self._handle_resolution,
+        }
         
     def _init_exchange(self):
         """Initialize simulated exchange from config."""
@@ -407,14 +415,17 @@ class BacktestEngine:
         logger.info(f"Strategies: {[s.name for s in self.strategies]}")
         
         # Process events
+        process_event = self._process_event
+        maybe_record_equity = self._maybe_record_equity
+        
         event_count = 0
         for event in self.data_feed.get_events():
             self.current_time = event.timestamp
-            self._process_event(event)
+            process_event(event)
             event_count += 1
             
             # Record equity periodically
-            self._maybe_record_equity()
+            maybe_record_equity()
             
             # Progress logging
             if event_count % 10000 == 0:
@@ -432,24 +443,33 @@ class BacktestEngine:
     
     def _process_event(self, event: SimulationEvent):
         """Process a single simulation event."""
-        if isinstance(event, MarketUpdateEvent):
+        handler = self._event_handlers.get(type(event))
+        if handler is not None:
+            handler(event)
+        elif isinstance(event, MarketUpdateEvent):
             self._handle_market_update(event)
         elif isinstance(event, ResolutionEvent):
             self._handle_resolution(event)
             
     def _handle_market_update(self, event: MarketUpdateEvent):
         """Handle market price update."""
-        # Update exchange state
-        snapshot = MarketSnapshot(
-            market_id=event.market_id,
-            platform=event.platform,
-            timestamp=event.timestamp,
-            question="",
-            yes_price=event.yes_price,
-            no_price=event.no_price,
-            volume_24h=event.volume
-        )
-        self.exchange.update_market(snapshot)
+        # Update exchange state, reusing the market's snapshot once it exists
+        snapshot = self.exchange.markets.get(event.market_id)
+        if snapshot is not None and snapshot.platform == event.platform:
+            snapshot.timestamp = event.timestamp
+            snapshot.yes_price = event.yes_price
+            snapshot.no_price = event.no_price
+            snapshot.volume_24h = event.volume
+        else:
+            self.exchange.update_market(MarketSnapshot(
+                market_id=event.market_id,
+                platform=event.platform,
+                timestamp=event.timestamp,
+                question="",
+                yes_price=event.yes_price,
+                no_price=event.no_price,
+                volume_24h=event.volume
+            ))
         
         # Let strategies react
         for strategy in self.strategies:
@@ -550,10 +570,8 @@ class BacktestEngine:
         if self.current_time is None:
             return
             
-        interval = timedelta(minutes=self.bt_config.record_equity_interval)
-        
         if self._last_equity_record is None or \
-           self.current_time - self._last_equity_record >= interval:
+           self.current_time - self._last_equity_record >= self._equity_interval:
             # Get current prices for unrealized P&L
             current_prices = {
                 market_id: snapshot.yes_price
@@ -618,7 +636,7 @@ class SimpleMovingAverageStrategy(TradingStrategy):
         self.lookback = lookback_periods
         self.position_size = position_size
         self.threshold = threshold
-        self.price_history: Dict[str, List[float]] = {}
+        self.price_history: Dict[str, Deque[float]] = {}
         
     def on_market_update(
         self,
@@ -629,21 +647,18 @@ class SimpleMovingAverageStrategy(TradingStrategy):
         market_id = event.market_id
         current_price = event.yes_price
         
-        # Update price history
-        if market_id not in self.price_history:
-            self.price_history[market_id] = []
-        self.price_history[market_id].append(current_price)
-        
-        # Keep only lookback periods
-        if len(self.price_history[market_id]) > self.lookback:
-            self.price_history[market_id] = self.price_history[market_id][-self.lookback:]
+        # Update price history; the bounded deque keeps only lookback periods
+        history = self.price_history.get(market_id)
+        if history is None:
+            history = self.price_history[market_id] = deque(maxlen=self.lookback)
+        history.append(current_price)
             
         # Need enough history
-        if len(self.price_history[market_id]) < self.lookback:
+        if len(history) < self.lookback:
             return []
             
         # Calculate SMA
-        sma = sum(self.price_history[market_id]) / len(self.price_history[market_id])
+        sma = sum(history) / len(history)
         
         orders = []
         position = portfolio.get_position(market_id)
@@ -0,0 +1,196 @@
+"""
+Unit Tests - Backtest Engine
+============================
+
+Tests for BacktestEngine event dispatch, market state and equity recording.
+"""
+
+import pytest
+import types
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import sys
+import os
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+# simulation/__init__.py also imports the optional data collection
+# subpackage, which is not always present. The engine does not need it, so
+# fall back to loading the submodules without running the package __init__.
+try:
+    import simulation  # noqa: F401
+except ImportError:
+    simulation = types.ModuleType("simulation")
+    simulation.__path__ = [os.path.join(ROOT, "simulation")]
+    sys.modules["simulation"] = simulation
+
+from simulation.backtest import (
+    BacktestEngine,
+    DataFeed,
+    SimpleMovingAverageStrategy,
+    TradingStrategy,
+)
+from simulation.config import SimulationConfig
+from simulation.models import (
+    MarketResolution,
+    MarketUpdateEvent,
+    Platform,
+    ResolutionEvent,
+    ResolutionOutcome,
+)
+
+
+START = datetime(2024, 1, 1)
+
+
+def make_update(market_id: str = "m1", minutes: int = 0, price: float = 0.5,
+                platform=Platform.POLYMARKET) -> MarketUpdateEvent:
+    """Create a market update at START + minutes."""
+    return MarketUpdateEvent(
+        timestamp=START + timedelta(minutes=minutes),
+        event_type="market_update",
+        market_id=market_id,
+        platform=platform,
+        yes_price=price,
+        no_price=1 - price,
+        volume=1000.0,
+    )
+
+
+def make_resolution(market_id: str = "m1", minutes: int = 0) -> ResolutionEvent:
+    """Create a YES resolution at START + minutes."""
+    timestamp = START + timedelta(minutes=minutes)
+    return ResolutionEvent(
+        timestamp=timestamp,
+        event_type="resolution",
+        resolution=MarketResolution(
+            market_id=market_id,
+            platform=Platform.POLYMARKET,
+            timestamp=timestamp,
+            outcome=ResolutionOutcome.YES,
+        ),
+    )
+
+
+class ListFeed(DataFeed):
+    """Data feed replaying a fixed list of events."""
+
+    def __init__(self, events):
+        super().__init__(START, START + timedelta(days=1), [Platform.POLYMARKET])
+        self.events = events
+
+    def get_events(self):
+        return iter(self.events)
+
+
+class RecordingStrategy(TradingStrategy):
+    """Strategy that records the events it sees and never trades."""
+
+    def __init__(self):
+        super().__init__("recording")
+        self.updates = []
+        self.resolutions = []
+
+    def on_market_update(self, event, portfolio):
+        self.updates.append(event)
+        return []
+
+    def on_resolution(self, event, portfolio):
+        self.resolutions.append(event)
+
+
+@pytest.fixture
+def strategy():
+    """Create a recording strategy."""
+    return RecordingStrategy()
+
+
+@pytest.fixture
+def engine(strategy):
+    """Create an engine running the recording strategy."""
+    engine = BacktestEngine(SimulationConfig())
+    engine.add_strategy(strategy)
+    return engine
+
+
+class TestEventDispatch:
+    """Tests for routing events to their handlers."""
+
+    def test_dispatches_by_event_type(self, engine, strategy):
+        """Test updates and resolutions reach the matching strategy hooks."""
+        update = make_update()
+        resolution = make_resolution(minutes=5)
+
+        engine._process_event(update)
+        engine._process_event(resolution)
+
+        assert strategy.updates == [update]
+        assert strategy.resolutions == [resolution]
+        assert engine.results.resolutions[0]["market_id"] == "m1"
+
+    def test_event_subclasses_still_handled(self, engine, strategy):
+        """Test subclasses missing from the handler table fall back to isinstance."""
+        @dataclass
+        class TaggedUpdate(MarketUpdateEvent):
+            tag: str = ""
+
+        event = TaggedUpdate(
+            timestamp=START, event_type="market_update", market_id="m1",
+            platform=Platform.POLYMARKET, yes_price=0.4, no_price=0.6, tag="x",
+        )
+
+        engine._process_event(event)
+
+        assert strategy.updates == [event]
+        assert engine.exchange.markets["m1"].yes_price == 0.4
+
+
+class TestMarketSnapshots:
+    """Tests for exchange market state updates."""
+
+    def test_snapshot_updated_in_place(self, engine):
+        """Test later updates reuse the market's snapshot."""
+        engine._process_event(make_update(price=0.4))
+        snapshot = engine.exchange.markets["m1"]
+
+        engine._process_event(make_update(minutes=5, price=0.6))
+
+        assert engine.exchange.markets["m1"] is snapshot
+        assert snapshot.yes_price == 0.6
+        assert snapshot.no_price == pytest.approx(0.4)
+        assert snapshot.timestamp == START + timedelta(minutes=5)
+
+    def test_platform_change_replaces_snapshot(self, engine):
+        """Test an update from another platform installs a fresh snapshot."""
+        engine._process_event(make_update(price=0.4))
+        snapshot = engine.exchange.markets["m1"]
+
+        engine._process_event(make_update(minutes=5, price=0.6, platform=Platform.KALSHI))
+
+        assert engine.exchange.markets["m1"] is not snapshot
+        assert engine.exchange.markets["m1"].platform == Platform.KALSHI
+
+
+class TestRun:
+    """Tests for full backtest runs."""
+
+    def test_equity_recorded_at_interval(self, engine):
+        """Test equity is recorded once per record_equity_interval, plus at the end."""
+        engine.set_data_feed(ListFeed([make_update(minutes=m) for m in range(0, 150, 10)]))
+
+        results = engine.run()
+
+        # Minutes 0, 60 and 120, then the final record
+        assert len(results.equity_curve) == 4
+
+    def test_sma_history_bounded(self):
+        """Test the SMA strategy keeps only lookback prices per market."""
+        strategy = SimpleMovingAverageStrategy(lookback_periods=3)
+        engine = BacktestEngine(SimulationConfig())
+        engine.add_strategy(strategy)
+        engine.set_data_feed(ListFeed([make_update(minutes=m, price=0.5) for m in range(10)]))
+
+        engine.run()
+
+        assert list(strategy.price_history["m1"]) == [0.5, 0.5, 0.5]
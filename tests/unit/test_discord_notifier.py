@@ -0,0 +1,125 @@
+"""
+Unit Tests - Discord Notifier
+=============================
+
+Tests for DiscordNotifier batching, flushing and duplicate suppression.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from shared.alert_service import Alert
+from shared.event_schemas import AlertSeverity
+from shared.notifications.discord import DiscordNotifier
+
+
+def make_alert(alert_id: str = "alert-1", title: str = "Position limit", message: str = "Limit reached") -> Alert:
+    """Create a minimal alert."""
+    return Alert(
+        alert_id=alert_id,
+        alert_type="risk",
+        severity=AlertSeverity.HIGH,
+        title=title,
+        message=message,
+        source="risk_manager",
+    )
+
+
+@pytest.fixture
+async def notifier():
+    """Create a batched notifier with the webhook POST mocked out."""
+    notifier = DiscordNotifier({
+        "webhook_url": "https://discord.example/webhook",
+        "batch_window": 0,
+    })
+    # The notifier uses __slots__, so patch the method on the class
+    with patch.object(DiscordNotifier, "_post", new=AsyncMock(return_value=True)):
+        yield notifier
+        await notifier.close()
+
+
+class TestFlushLoop:
+    """Tests for the batched flush loop."""
+
+    async def test_coalesces_queued_alerts(self, notifier):
+        """Test alerts queued together are posted as one message."""
+        for i in range(3):
+            assert await notifier.send_alert(make_alert(f"alert-{i}", title=f"Alert {i}"))
+
+        await notifier.flush()
+
+        notifier._post.assert_awaited_once()
+        embeds, _ = notifier._post.await_args.args
+        assert len(embeds) == 3
+
+    async def test_splits_at_embed_limit(self, notifier):
+        """Test no message carries more than MAX_EMBEDS_PER_MESSAGE embeds."""
+        for i in range(DiscordNotifier.MAX_EMBEDS_PER_MESSAGE + 2):
+            await notifier.send_alert(make_alert(f"alert-{i}", title=f"Alert {i}"))
+
+        await notifier.flush()
+
+        sizes = [len(call.args[0]) for call in notifier._post.await_args_list]
+        assert sizes == [DiscordNotifier.MAX_EMBEDS_PER_MESSAGE, 2]
+
+    async def test_drops_malformed_embed(self, notifier):
+        """Test a malformed embed is dropped without stopping the loop."""
+        notifier._enqueue("", {"title": "broken", "fields": [{"name": "no value"}]})
+        await notifier.send_alert(make_alert())
+
+        await notifier.flush()
+
+        notifier._post.assert_awaited_once()
+        embeds, _ = notifier._post.await_args.args
+        assert [embed["description"] for embed in embeds] == ["Limit reached"]
+        assert not notifier._flusher_task.done()
+
+    async def test_survives_post_errors(self, notifier):
+        """Test a failing POST does not stall flush or kill the loop."""
+        notifier._post.side_effect = [RuntimeError("boom"), True]
+
+        await notifier.send_alert(make_alert("alert-1", title="First"))
+        await notifier.flush()
+        await notifier.send_alert(make_alert("alert-2", title="Second"))
+        await notifier.flush()
+
+        assert notifier._post.await_count == 2
+        assert not notifier._flusher_task.done()
+
+
+class TestDuplicateSuppression:
+    """Tests for dedupe_window handling."""
+
+    async def test_suppresses_repeat_alert(self, notifier):
+        """Test an identical alert within the window is not sent again."""
+        assert await notifier.send_alert(make_alert("alert-1"))
+        assert await notifier.send_alert(make_alert("alert-2"))
+
+        await notifier.flush()
+
+        embeds, _ = notifier._post.await_args.args
+        assert len(embeds) == 1
+
+    async def test_failed_build_not_recorded(self, notifier):
+        """Test an alert that fails to build can be retried."""
+        with patch.object(DiscordNotifier, "_build_embed", side_effect=ValueError("bad")):
+            assert not await notifier.send_alert(make_alert())
+
+        assert await notifier.send_alert(make_alert())
+        await notifier.flush()
+
+        notifier._post.assert_awaited_once()
+
+    async def test_failed_post_not_recorded(self, notifier):
+        """Test an unbatched alert whose POST fails can be retried."""
+        notifier.batched = False
+        notifier._post.side_effect = [False, True]
+
+        assert not await notifier.send_alert(make_alert())
+        assert await notifier.send_alert(make_alert())
+
+        assert notifier._post.await_count == 2
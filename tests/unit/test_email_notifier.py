@@ -0,0 +1,166 @@
+"""
+Unit Tests - Email Notifier
+===========================
+
+Tests for EmailNotifier rate limiting, duplicate suppression and batching.
+"""
+
+import email
+import pytest
+from email import policy
+from unittest.mock import AsyncMock, patch
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from shared.alert_service import Alert
+from shared.event_schemas import AlertSeverity
+from shared.notifications.email import EmailNotifier, _TokenBucket
+
+
+def make_alert(alert_id: str = "alert-1", title: str = "Position limit", severity=AlertSeverity.HIGH) -> Alert:
+    """Create a minimal alert."""
+    return Alert(
+        alert_id=alert_id,
+        alert_type="risk",
+        severity=severity,
+        title=title,
+        message="Limit reached",
+        source="risk_manager",
+    )
+
+
+def make_notifier(**overrides) -> EmailNotifier:
+    """Create a notifier with one recipient and no template directory."""
+    config = {
+        "to_emails": ["ops@example.com"],
+        "template_dir": "/nonexistent",
+        "local_hostname": "localhost",
+    }
+    config.update(overrides)
+    return EmailNotifier(config)
+
+
+@pytest.fixture
+def smtp():
+    """Mock the SMTP batch send, reporting every message as delivered."""
+    send = AsyncMock(side_effect=lambda messages: [None] * len(messages))
+    with patch("shared.notifications.email.AIOSMTPLIB_AVAILABLE", True), \
+            patch.object(EmailNotifier, "_send_batch_async", new=send):
+        yield send
+
+
+class TestTokenBucket:
+    """Tests for the token bucket."""
+
+    def test_allows_burst_up_to_capacity(self):
+        """Test a full bucket allows capacity sends, then refuses."""
+        bucket = _TokenBucket(capacity=3, rate=0)
+
+        assert [bucket.try_consume() for _ in range(4)] == [True, True, True, False]
+
+    def test_refills_over_time(self):
+        """Test tokens come back at rate per second."""
+        bucket = _TokenBucket(capacity=1, rate=10)
+        assert bucket.try_consume()
+        assert not bucket.try_consume()
+
+        bucket.last -= 0.2
+
+        assert bucket.try_consume()
+
+    def test_refill_capped_at_capacity(self):
+        """Test an idle bucket never holds more than capacity."""
+        bucket = _TokenBucket(capacity=2, rate=10)
+        bucket.last -= 60
+
+        assert [bucket.try_consume() for _ in range(3)] == [True, True, False]
+
+
+class TestSendAlert:
+    """Tests for queueing, dedupe and batching in send_alert."""
+
+    async def test_batches_queued_alerts(self, smtp):
+        """Test alerts queued together go out in one batch."""
+        notifier = make_notifier()
+        for i in range(3):
+            assert await notifier.send_alert(make_alert(f"alert-{i}", title=f"Alert {i}"))
+
+        await notifier.close()
+
+        smtp.assert_awaited_once()
+        assert len(smtp.await_args.args[0]) == 3
+
+    async def test_batches_capped_at_max_batch(self, smtp):
+        """Test no batch holds more than max_batch messages."""
+        notifier = make_notifier(max_batch=2)
+        for i in range(5):
+            await notifier.send_alert(make_alert(f"alert-{i}", title=f"Alert {i}"))
+
+        await notifier.close()
+
+        assert [len(call.args[0]) for call in smtp.await_args_list] == [2, 2, 1]
+
+    async def test_duplicate_suppressed(self, smtp):
+        """Test a repeat within dedupe_window is reported handled but not sent."""
+        notifier = make_notifier()
+
+        assert await notifier.send_alert(make_alert("alert-1"))
+        assert await notifier.send_alert(make_alert("alert-2"))
+        await notifier.close()
+
+        assert len(smtp.await_args.args[0]) == 1
+
+    async def test_rate_limited_alert_not_recorded(self, smtp):
+        """Test an alert dropped by the rate limiter can be sent later."""
+        notifier = make_notifier(rate_limit_capacity=1, rate_limit_per_sec=0)
+        assert await notifier.send_alert(make_alert("alert-1", title="First"))
+        assert not await notifier.send_alert(make_alert("alert-2", title="Second"))
+
+        notifier._bucket.tokens = 1
+
+        assert await notifier.send_alert(make_alert("alert-3", title="Second"))
+        await notifier.close()
+
+        assert sum(len(call.args[0]) for call in smtp.await_args_list) == 2
+
+    async def test_severity_window_limits_floods(self, smtp):
+        """Test a severity's per-window limit applies before the shared bucket."""
+        notifier = make_notifier(severity_rate_limits={"low": 2})
+        results = [
+            await notifier.send_alert(make_alert(f"alert-{i}", title=f"Alert {i}", severity=AlertSeverity.LOW))
+            for i in range(3)
+        ]
+        await notifier.close()
+
+        assert results == [True, True, False]
+
+    async def test_wait_reports_delivery(self, smtp):
+        """Test wait=True returns the SMTP result and skips dedupe."""
+        smtp.side_effect = lambda messages: [OSError("refused")] * len(messages)
+        notifier = make_notifier()
+        await notifier.send_alert(make_alert())
+
+        assert not await notifier.send_alert(make_alert(), wait=True)
+        await notifier.close()
+
+        assert sum(len(call.args[0]) for call in smtp.await_args_list) == 2
+
+
+class TestBuildMessage:
+    """Tests for the serialized email message."""
+
+    def test_bodies_are_seven_bit_safe(self):
+        """Test non-ASCII bodies are base64-encoded rather than sent as 8bit."""
+        notifier = make_notifier()
+        alert = make_alert(title="Position limit ⚠️")
+
+        raw = notifier._build_message(alert, notifier._derive(alert))
+
+        message = email.message_from_bytes(raw, policy=policy.default)
+        parts = list(message.iter_parts())
+        assert [part.get_content_type() for part in parts] == ["text/plain", "text/html"]
+        assert [part["Content-Transfer-Encoding"] for part in parts] == ["base64", "base64"]
+        assert "⚠️" in parts[1].get_content()
+        assert raw.isascii()
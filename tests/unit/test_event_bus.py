@@ -227,6 +227,30 @@ class TestAsyncEventBus:
             
             assert result is True
             assert async_event_bus._connected is True
+    
+    @pytest.mark.asyncio
+    async def test_publish_many_uses_single_pipeline(self, async_event_bus):
+        """Test batch publish queues every event on one pipeline."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[1, 1])
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=False)
+        async_event_bus.redis = MagicMock()
+        async_event_bus.redis.pipeline.return_value = pipe
+        async_event_bus._connected = True
+        
+        result = await async_event_bus.publish_many(
+            EventType.NEWS_BREAKING,
+            [{"id": "a"}, {"id": "b"}],
+        )
+        
+        assert result is True
+        async_event_bus.redis.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.publish.call_count == 2
+        channel, message = pipe.publish.call_args_list[0].args
+        assert channel == "predictbot:events:news.breaking"
+        assert json.loads(message)["data"] == {"id": "a"}
+        pipe.execute.assert_awaited_once()
 
 
 class TestCreateEventBus:
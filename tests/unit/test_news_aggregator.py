@@ -0,0 +1,419 @@
+"""
+Unit Tests - News Aggregator
+============================
+
+Tests for NewsFeedAggregator filtering, feed parsing and the shared
+article store.
+"""
+
+import asyncio
+import json
+import feedparser
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from shared.news_feed import (
+    LXML_AVAILABLE,
+    NewsArticle,
+    NewsFeedAggregator,
+    NewsFeedConfig,
+    NewsSource,
+    RSSFeedClient,
+    _fast_rss_parse,
+)
+
+RSS_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/"
+     xmlns:content="http://purl.org/rss/1.0/modules/content/">
+  <channel>
+    <title>Example</title>
+    <item>
+      <title>Fed holds rates</title>
+      <link> https://example.com/fed </link>
+      <guid>fed-1</guid>
+      <description>&lt;p&gt;Rates unchanged&lt;/p&gt;</description>
+      <pubDate>Mon, 15 Jan 2024 10:00:00 GMT</pubDate>
+      <dc:creator>Jane Doe</dc:creator>
+      <content:encoded>Full story</content:encoded>
+    </item>
+    <item>
+      <title>No date or link</title>
+      <guid>nodate-1</guid>
+    </item>
+    <item>
+      <title>Nothing to key on</title>
+    </item>
+  </channel>
+</rss>
+"""
+
+ATOM_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Example</title>
+  <entry>
+    <title>Election results</title>
+    <link href="https://example.com/election"/>
+    <id>urn:example:election</id>
+    <summary>Polls closed</summary>
+    <published>2024-01-15T12:00:00+02:00</published>
+    <author><name>John Roe</name></author>
+  </entry>
+</feed>
+"""
+
+
+def make_article(article_id: str = "a1", title: str = "", description: str = "") -> NewsArticle:
+    """Create a minimal article for filtering tests."""
+    return NewsArticle(
+        id=article_id,
+        title=title,
+        description=description,
+        content=None,
+        url=f"https://example.com/{article_id}",
+        source=NewsSource.RSS,
+        source_name="example.com",
+        published_at=datetime(2024, 1, 15, 10, 0, 0),
+    )
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio calls the article store makes."""
+
+    def __init__(self):
+        self.values = {}
+        self.expiry = {}
+        self.zsets = {}
+
+    async def ping(self):
+        return True
+
+    async def close(self):
+        pass
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+        self.expiry[key] = ex
+
+    def zremrangebyscore(self, key, low, high):
+        zset = self.zsets.get(key, {})
+        for member in [m for m, score in zset.items() if score <= high]:
+            del zset[member]
+
+    async def zrevrangebyscore(self, key, high, low, start=0, num=None):
+        low = float(low[1:]) if isinstance(low, str) and low.startswith("(") else float(low)
+        members = sorted(
+            ((m, score) for m, score in self.zsets.get(key, {}).items() if score > low),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        return [m.encode() for m, _ in members[start:start + num]]
+
+    async def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+
+class FakePipeline:
+    """Buffers commands and applies them to a FakeRedis on execute."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    async def execute(self):
+        for name, args, kwargs in self.commands:
+            getattr(self.redis, name)(*args, **kwargs)
+        self.commands = []
+
+
+class TestKeywordFilter:
+    """Tests for keyword filtering."""
+
+    @pytest.fixture
+    def aggregator(self):
+        """Create an aggregator with a small keyword list."""
+        config = NewsFeedConfig(keywords=["fed", "federal reserve", "elect", "$BTC"])
+        return NewsFeedAggregator(config)
+
+    def test_matches_substrings(self, aggregator):
+        """Test keywords match inside longer words, as a substring scan would."""
+        article = make_article(title="Federal Reserve holds rates ahead of election")
+
+        result = list(aggregator._filter_by_keywords([article]))
+
+        assert result == [article]
+        assert article.keywords == ["fed", "federal reserve", "elect"]
+        assert article.relevance_score == 3 / 4
+
+    def test_matches_keywords_with_symbols(self, aggregator):
+        """Test keywords starting with a non-word character still match."""
+        article = make_article(description="Traders pile into $btc options")
+
+        result = list(aggregator._filter_by_keywords([article]))
+
+        assert result == [article]
+        assert article.keywords == ["$btc"]
+
+    def test_drops_unmatched_articles(self, aggregator):
+        """Test articles without any keyword are filtered out."""
+        article = make_article(title="Local bakery wins award")
+
+        assert list(aggregator._filter_by_keywords([article])) == []
+
+    def test_matcher_rebuilt_when_keywords_change(self, aggregator):
+        """Test the compiled matcher follows config.keywords."""
+        article = make_article(title="Hurricane season outlook")
+        assert list(aggregator._filter_by_keywords([article])) == []
+
+        aggregator.config.keywords = ["hurricane"]
+
+        assert list(aggregator._filter_by_keywords([article])) == [article]
+        assert article.keywords == ["hurricane"]
+
+
+class TestArticleSerialization:
+    """Tests for NewsArticle dict round-trips."""
+
+    def test_round_trip(self):
+        """Test from_dict restores what to_dict produced, through JSON."""
+        article = make_article(title="Fed holds", description="Rates unchanged")
+        article.keywords = ["fed"]
+        article.relevance_score = 0.5
+
+        restored = NewsArticle.from_dict(json.loads(json.dumps(article.to_dict())))
+
+        assert restored == article
+        assert restored.source is NewsSource.RSS
+
+    def test_published_at_normalized_to_naive_utc(self):
+        """Test offset timestamps are parsed the same way as feed times."""
+        data = make_article().to_dict()
+        data["published_at"] = "2024-01-15T12:00:00+02:00"
+
+        restored = NewsArticle.from_dict(data)
+
+        assert restored.published_at == datetime(2024, 1, 15, 10, 0, 0)
+
+
+@pytest.mark.skipif(not LXML_AVAILABLE, reason="lxml not available")
+class TestFastRSSParse:
+    """Tests for the streaming lxml feed parser."""
+
+    def test_rss_item(self):
+        """Test RSS 2.0 items map to feedparser-shaped entries."""
+        entry = _fast_rss_parse(RSS_FEED)[0]
+
+        assert entry["title"] == "Fed holds rates"
+        assert entry["link"] == "https://example.com/fed"
+        assert entry["id"] == "fed-1"
+        assert entry["summary"] == "<p>Rates unchanged</p>"
+        assert tuple(entry["published_parsed"][:6]) == (2024, 1, 15, 10, 0, 0)
+        assert entry["author"] == "Jane Doe"
+        assert entry["content"] == [{"value": "Full story"}]
+
+    def test_atom_entry(self):
+        """Test Atom entries read href links and normalize offsets to UTC."""
+        entry = _fast_rss_parse(ATOM_FEED)[0]
+
+        assert entry["title"] == "Election results"
+        assert entry["link"] == "https://example.com/election"
+        assert entry["id"] == "urn:example:election"
+        assert entry["summary"] == "Polls closed"
+        assert tuple(entry["published_parsed"][:6]) == (2024, 1, 15, 10, 0, 0)
+        assert entry["author"] == "John Roe"
+        assert entry["content"] is None
+
+    def test_missing_date_and_link(self):
+        """Test absent fields come back empty rather than raising."""
+        entry = _fast_rss_parse(RSS_FEED)[1]
+
+        assert "link" not in entry
+        assert entry["id"] == "nodate-1"
+        assert entry["published_parsed"] is None
+        assert entry["author"] is None
+
+    def test_malformed_xml_raises(self):
+        """Test broken documents raise so the caller can fall back."""
+        from lxml import etree
+
+        with pytest.raises(etree.XMLSyntaxError):
+            _fast_rss_parse(b"<rss><channel><item><title>Open")
+
+
+class TestRSSFeedClient:
+    """Tests for RSS feed parsing in RSSFeedClient."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a client with a dummy session."""
+        return RSSFeedClient(MagicMock())
+
+    def test_parses_feed_into_articles(self, client):
+        """Test entries become articles, skipping ones without link or id."""
+        articles = client._parse_entries(
+            client._parse_feed(RSS_FEED, "https://example.com/feed"),
+            "https://example.com/feed",
+        )
+
+        # Undated entries are stamped with the fetch time, so sort first
+        assert [a.title for a in articles] == ["No date or link", "Fed holds rates"]
+        fed = next(a for a in articles if a.title == "Fed holds rates")
+        assert fed.url == "https://example.com/fed"
+        assert fed.description == "Rates unchanged"
+        assert fed.source_name == "example.com"
+        assert fed.published_at == datetime(2024, 1, 15, 10, 0, 0)
+
+    def test_falls_back_to_feedparser_on_malformed_xml(self, client):
+        """Test feedparser handles documents lxml rejects."""
+        broken = RSS_FEED.replace(b"</channel>", b"")
+
+        with patch("shared.news_feed.feedparser.parse", wraps=feedparser.parse) as parse:
+            entries = client._parse_feed(broken, "https://example.com/feed")
+
+        parse.assert_called_once()
+        assert entries[0]["title"] == "Fed holds rates"
+
+    def test_skips_malformed_entries(self, client):
+        """Test entries raising _MALFORMED_ERRORS are skipped, not fatal."""
+        entries = [
+            {"link": "https://example.com/ok", "title": "Ok"},
+            {"link": "https://example.com/bad", "published_parsed": "not a time tuple"},
+            {"link": "https://example.com/bad", "content": [None]},
+        ]
+
+        articles = client._parse_entries(entries, "https://example.com/feed")
+
+        assert [a.title for a in articles] == ["Ok"]
+
+
+class TestArticleStore:
+    """Tests for the Redis-backed shared article store."""
+
+    @pytest.fixture
+    def redis(self):
+        """Route aioredis.from_url to an in-memory fake."""
+        fake = FakeRedis()
+        aioredis = MagicMock()
+        aioredis.from_url.return_value = fake
+        with patch("shared.news_feed.REDIS_AVAILABLE", True), \
+                patch("shared.news_feed.aioredis", aioredis):
+            yield fake
+
+    @pytest.fixture
+    def aggregator(self, redis):
+        """Create an aggregator with a Redis URL configured."""
+        return NewsFeedAggregator(NewsFeedConfig(), redis_url="redis://localhost:6379/0")
+
+    async def test_store_and_read_back(self, aggregator, redis):
+        """Test stored articles are read back newest first as equal articles."""
+        now = datetime.utcnow().replace(microsecond=0)
+        older = make_article("old", title="Older")
+        older.published_at = now - timedelta(hours=2)
+        newer = make_article("new", title="Newer")
+        newer.published_at = now - timedelta(minutes=5)
+
+        await aggregator._store_articles([older, newer])
+        result = await aggregator.get_recent_articles(now - timedelta(hours=3))
+
+        assert result == [newer, older]
+        assert set(redis.expiry.values()) == {NewsFeedAggregator.ARTICLE_STORE_TTL}
+
+    async def test_since_and_limit(self, aggregator):
+        """Test only articles after since are returned, up to limit."""
+        now = datetime.utcnow().replace(microsecond=0)
+        articles = []
+        for i in range(3):
+            article = make_article(f"a{i}", title=f"Article {i}")
+            article.published_at = now - timedelta(minutes=10 * i)
+            articles.append(article)
+        await aggregator._store_articles(articles)
+
+        assert await aggregator.get_recent_articles(now - timedelta(minutes=15)) == articles[:2]
+        assert await aggregator.get_recent_articles(now - timedelta(hours=1), limit=1) == articles[:1]
+
+    async def test_expired_articles_pruned_from_index(self, aggregator, redis):
+        """Test articles older than the TTL are dropped from the index on write."""
+        stale = make_article("stale")
+        stale.published_at = datetime.utcnow() - timedelta(seconds=NewsFeedAggregator.ARTICLE_STORE_TTL + 60)
+        fresh = make_article("fresh")
+        fresh.published_at = datetime.utcnow()
+
+        await aggregator._store_articles([stale, fresh])
+
+        assert list(redis.zsets[NewsFeedAggregator.ARTICLE_INDEX_KEY]) == ["fresh"]
+
+    async def test_unavailable_store_returns_none(self, aggregator, redis):
+        """Test a failed connect reports None and is not retried immediately."""
+        redis.ping = AsyncMock(side_effect=ConnectionError("refused"))
+
+        assert await aggregator.get_recent_articles(datetime(2024, 1, 1)) is None
+        assert await aggregator.get_recent_articles(datetime(2024, 1, 1)) is None
+
+        redis.ping.assert_awaited_once()
+
+
+class TestInflightFetches:
+    """Tests for sharing source fetches between overlapping callers."""
+
+    @pytest.fixture
+    def aggregator(self):
+        """Create an aggregator with one RSS feed and a mocked RSS client."""
+        aggregator = NewsFeedAggregator(NewsFeedConfig(
+            keywords=[],
+            rss_feeds=["https://example.com/feed"],
+        ))
+        aggregator._session = MagicMock(closed=False)
+        aggregator._rss = MagicMock()
+        return aggregator
+
+    async def test_overlapping_callers_share_one_fetch(self, aggregator):
+        """Test a fetch_all overlapping the refresh loop reuses its request."""
+        release = asyncio.Event()
+
+        async def fetch_feed(feed_url):
+            await release.wait()
+            return [make_article("a1", title="Fed holds")]
+
+        aggregator._rss.fetch_feed = AsyncMock(side_effect=fetch_feed)
+
+        refresh = asyncio.create_task(aggregator._fetch_sources())
+        fetch = asyncio.create_task(aggregator.fetch_all())
+        await asyncio.sleep(0)
+        release.set()
+
+        refreshed, fetched = await asyncio.gather(refresh, fetch)
+
+        aggregator._rss.fetch_feed.assert_awaited_once()
+        assert [a.id for a in refreshed[0]] == ["a1"]
+        assert [a.id for a in fetched] == ["a1"]
+        assert not aggregator._inflight
+
+    async def test_failed_fetch_not_cached(self, aggregator):
+        """Test a failed fetch is retried by the next caller."""
+        aggregator._rss.fetch_feed = AsyncMock(side_effect=[
+            RuntimeError("boom"),
+            [make_article("a1")],
+        ])
+
+        assert await aggregator._fetch_sources() == []
+        assert [a.id for a in (await aggregator._fetch_sources())[0]] == ["a1"]
+        assert aggregator._rss.fetch_feed.await_count == 2
@@ -0,0 +1,161 @@
+"""
+Unit Tests - Slack Notifier
+===========================
+
+Tests for SlackNotifier burst coalescing and the background send queue.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from shared.alert_service import Alert
+from shared.event_schemas import AlertSeverity
+from shared.notifications.slack import SlackNotifier
+
+
+def make_alert(alert_id: str = "alert-1", severity=AlertSeverity.HIGH, entity_id: str = "market-1") -> Alert:
+    """Create a minimal alert."""
+    return Alert(
+        alert_id=alert_id,
+        alert_type="risk",
+        severity=severity,
+        title="Position limit",
+        message="Limit reached",
+        source="risk_manager",
+        related_entity_id=entity_id,
+    )
+
+
+def make_notifier(**overrides) -> SlackNotifier:
+    """Create a notifier with the webhook POST mocked out."""
+    config = {"webhook_url": "https://hooks.slack.example/services/T/B/X"}
+    config.update(overrides)
+    notifier = SlackNotifier(config)
+    notifier._post = AsyncMock(return_value=True)
+    return notifier
+
+
+def posted_messages(notifier: SlackNotifier) -> list:
+    """Get the message section text of every posted payload, in order."""
+    return [call.args[0]["blocks"][1]["text"]["text"] for call in notifier._post.await_args_list]
+
+
+def posted_fallbacks(notifier: SlackNotifier) -> list:
+    """Get the attachment fallback text of every posted payload, in order."""
+    return [call.args[0]["attachments"][0]["fallback"] for call in notifier._post.await_args_list]
+
+
+class TestCoalescing:
+    """Tests for coalescing bursts of repeated alerts."""
+
+    async def test_repeats_summarized_after_window(self):
+        """Test repeats are counted and summarized once the window ends."""
+        notifier = make_notifier(coalesce_window=0.01)
+
+        results = [await notifier.send_alert(make_alert(f"alert-{i}")) for i in range(3)]
+        assert results == [True, True, True]
+        assert notifier._post.await_count == 1
+
+        await asyncio.sleep(0.05)
+
+        assert notifier._post.await_count == 2
+        assert "occurred 3 times" in posted_messages(notifier)[1]
+        assert not notifier._bursts
+        await notifier.close()
+
+    async def test_single_alert_has_no_summary(self):
+        """Test a burst of one sends nothing more when it ends."""
+        notifier = make_notifier(coalesce_window=0.01)
+
+        await notifier.send_alert(make_alert())
+        await asyncio.sleep(0.05)
+
+        assert notifier._post.await_count == 1
+        await notifier.close()
+
+    async def test_escalation_not_coalesced(self):
+        """Test a higher-severity repeat is sent rather than counted."""
+        notifier = make_notifier()
+
+        await notifier.send_alert(make_alert("alert-1", severity=AlertSeverity.MEDIUM))
+        await notifier.send_alert(make_alert("alert-2", severity=AlertSeverity.CRITICAL))
+
+        assert notifier._post.await_count == 2
+        await notifier.close()
+
+    async def test_other_entities_not_coalesced(self):
+        """Test alerts about different entities are sent separately."""
+        notifier = make_notifier()
+
+        await notifier.send_alert(make_alert("alert-1", entity_id="market-1"))
+        await notifier.send_alert(make_alert("alert-2", entity_id="market-2"))
+
+        assert notifier._post.await_count == 2
+        await notifier.close()
+
+    async def test_close_sends_pending_summaries(self):
+        """Test close summarizes open bursts without waiting out the window."""
+        notifier = make_notifier(coalesce_window=60)
+        for i in range(2):
+            await notifier.send_alert(make_alert(f"alert-{i}"))
+
+        await asyncio.wait_for(notifier.close(), timeout=1)
+
+        assert notifier._post.await_count == 2
+        assert "occurred 2 times" in posted_messages(notifier)[1]
+        assert not notifier._bursts
+
+    async def test_disabled_window_sends_everything(self):
+        """Test coalesce_window=0 sends every alert."""
+        notifier = make_notifier(coalesce_window=0)
+
+        for i in range(3):
+            await notifier.send_alert(make_alert(f"alert-{i}"))
+
+        assert notifier._post.await_count == 3
+        await notifier.close()
+
+
+class TestSendQueue:
+    """Tests for send_alert_nowait and flush."""
+
+    async def test_flush_waits_for_queued_alerts(self):
+        """Test flush returns once every queued alert has been posted."""
+        notifier = make_notifier(coalesce_window=0)
+
+        for i in range(3):
+            assert notifier.send_alert_nowait(make_alert(f"alert-{i}", entity_id=f"market-{i}"))
+        await asyncio.wait_for(notifier.flush(), timeout=1)
+
+        assert notifier._post.await_count == 3
+        await notifier.close()
+
+    async def test_most_severe_sent_first(self):
+        """Test queued alerts are drained in severity order."""
+        notifier = make_notifier(coalesce_window=0)
+
+        notifier.send_alert_nowait(make_alert("low", severity=AlertSeverity.LOW))
+        notifier.send_alert_nowait(make_alert("critical", severity=AlertSeverity.CRITICAL))
+        notifier.send_alert_nowait(make_alert("medium", severity=AlertSeverity.MEDIUM))
+        await notifier.flush()
+
+        severities = [text.split("]")[0] for text in posted_fallbacks(notifier)]
+        assert severities == ["[CRITICAL", "[MEDIUM", "[LOW"]
+        await notifier.close()
+
+    async def test_full_queue_drops_least_severe(self):
+        """Test a full queue drops its least severe alert for a more severe one."""
+        notifier = make_notifier(coalesce_window=0, queue_size=2)
+
+        assert notifier.send_alert_nowait(make_alert("low", severity=AlertSeverity.LOW))
+        assert notifier.send_alert_nowait(make_alert("medium", severity=AlertSeverity.MEDIUM))
+        assert not notifier.send_alert_nowait(make_alert("info", severity=AlertSeverity.INFO))
+        assert notifier.send_alert_nowait(make_alert("critical", severity=AlertSeverity.CRITICAL))
+
+        assert sorted(alert.alert_id for _, _, alert in notifier._pending) == ["critical", "medium"]
+        await notifier.close()
@@ -0,0 +1,167 @@
+"""
+Unit Tests - WebSocket Server
+=============================
+
+Tests for WebSocketManager fan-out, per-client send queues and frame types.
+"""
+
+import asyncio
+import json
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from fastapi.websockets import WebSocketState
+
+from shared.websocket_server import WebSocketManager
+
+
+class FakeWebSocket:
+    """Records frames sent to it; sends block while the gate is closed."""
+
+    def __init__(self, query_params=None):
+        self.client_state = WebSocketState.CONNECTED
+        self.query_params = query_params or {}
+        self.frames = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.fail = False
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        await self._send(text)
+
+    async def send_bytes(self, data):
+        await self._send(data)
+
+    async def _send(self, frame):
+        await self.gate.wait()
+        if self.fail:
+            raise ConnectionError("socket closed")
+        self.frames.append(frame)
+
+    @property
+    def messages(self):
+        return [json.loads(frame) for frame in self.frames]
+
+
+async def settle():
+    """Let writer tasks drain their queues."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def manager():
+    """Create a manager that does not require authentication."""
+    return WebSocketManager(require_auth=False, send_queue_size=4)
+
+
+async def connect(manager, query_params=None, channels=("trades",)):
+    """Connect a fake client and subscribe it to channels."""
+    websocket = FakeWebSocket(query_params)
+    client = await manager.connect(websocket)
+    await manager.handle_message(client.id, json.dumps({"type": "subscribe", "channels": list(channels)}))
+    await settle()
+    websocket.frames.clear()
+    return client, websocket
+
+
+class TestFrames:
+    """Tests for text, binary and batch frames."""
+
+    async def test_text_frames_by_default(self, manager):
+        """Test clients receive text frames unless they opt in to binary."""
+        _, websocket = await connect(manager)
+
+        await manager.broadcast("trades", "trade.filled", {"id": 1})
+        await settle()
+
+        assert isinstance(websocket.frames[0], str)
+        message = websocket.messages[0]
+        assert (message["type"], message["channel"], message["data"]) == ("event", "trades", {"id": 1})
+
+    async def test_binary_frames_opt_in(self, manager):
+        """Test ?frames=binary clients receive the payload bytes."""
+        _, websocket = await connect(manager, {"frames": "binary"})
+
+        await manager.broadcast("trades", "trade.filled", {"id": 1})
+        await settle()
+
+        assert isinstance(websocket.frames[0], bytes)
+        assert websocket.messages[0]["data"] == {"id": 1}
+
+    async def test_batch_frames_coalesce_backlog(self, manager):
+        """Test ?batch=1 clients get queued messages in one batch frame."""
+        _, websocket = await connect(manager, {"batch": "1"})
+
+        for i in range(4):
+            await manager.broadcast("trades", "trade.filled", {"id": i})
+        await settle()
+
+        assert [m["type"] for m in websocket.messages] == ["batch"]
+        batch = websocket.messages[0]["messages"]
+        assert [m["data"]["id"] for m in batch] == [0, 1, 2, 3]
+
+    async def test_unbatched_clients_get_one_frame_per_message(self, manager):
+        """Test clients without ?batch=1 never receive batch frames."""
+        _, websocket = await connect(manager)
+
+        for i in range(3):
+            await manager.broadcast("trades", "trade.filled", {"id": i})
+        await settle()
+
+        assert [m["data"]["id"] for m in websocket.messages] == [0, 1, 2]
+
+
+class TestSendQueue:
+    """Tests for the per-client writer queue."""
+
+    async def test_slow_client_drops_oldest(self, manager):
+        """Test a full queue drops its oldest message and counts the drop."""
+        client, websocket = await connect(manager)
+
+        for i in range(10):
+            await manager.broadcast("trades", "trade.filled", {"id": i})
+        await settle()
+
+        # Only the newest send_queue_size messages survive
+        assert [m["data"]["id"] for m in websocket.messages] == [6, 7, 8, 9]
+        assert client.dropped_messages == 6
+        assert manager.get_stats()["dropped_messages"] == 6
+
+    async def test_slow_client_does_not_block_others(self, manager):
+        """Test broadcasts return while one client's socket is stalled."""
+        _, slow = await connect(manager)
+        _, fast = await connect(manager)
+        slow.gate.clear()
+
+        await asyncio.wait_for(manager.broadcast("trades", "trade.filled", {"id": 1}), timeout=1)
+        await settle()
+
+        assert len(fast.messages) == 1
+        assert slow.messages == []
+
+    async def test_failed_send_disconnects_client(self, manager):
+        """Test a socket that errors is dropped from the manager."""
+        client, websocket = await connect(manager)
+        websocket.fail = True
+
+        await manager.broadcast("trades", "trade.filled", {"id": 1})
+        await settle()
+
+        assert client.id not in manager.clients
+        assert not manager.has_subscribers("trades")
+
+    async def test_disconnect_stops_writer(self, manager):
+        """Test disconnect cancels the client's writer task."""
+        client, _ = await connect(manager)
+
+        manager.disconnect(client.id)
+        await settle()
+
+        assert client.writer_task.cancelled()